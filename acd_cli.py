@@ -10,16 +10,20 @@ import time
 import re
 import appdirs
 
-from collections import namedtuple
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from configparser import ConfigParser
 from functools import partial
-from multiprocessing import Event
+from threading import Event
 
 from pkgutil import walk_packages
-from pkg_resources import iter_entry_points
+
+try:
+    from os import scandir
+except ImportError:
+    from scandir import scandir
 
 import acdcli
-from acdcli.api import client
 from acdcli.api.common import RequestError, is_valid_id
 from acdcli.cache import format, db
 from acdcli.utils import hashing, progress
@@ -35,9 +39,27 @@ for importer, modname, ispkg in walk_packages(path=plugins.__path__, prefix=plug
     if not ispkg:
         __import__(modname)
 
+
+def entry_point_modules(group: str) -> 'Generator[str]':
+    """Yields the module names of the entry points in *group*. Uses :mod:`importlib.metadata`
+    where available, as importing :mod:`pkg_resources` is slow."""
+    try:
+        from importlib.metadata import entry_points
+    except ImportError:
+        from pkg_resources import iter_entry_points
+        for entry_point in iter_entry_points(group=group, name=None):
+            yield entry_point.module_name
+        return
+
+    eps = entry_points()
+    eps = eps.select(group=group) if hasattr(eps, 'select') else eps.get(group, [])
+    for entry_point in eps:
+        yield entry_point.value.partition(':')[0].strip()
+
+
 # load additional plugins from entry point
-for plug_mod in iter_entry_points(group='acdcli.plugins', name=None):
-    __import__(plug_mod.module_name)
+for plug_mod in entry_point_modules('acdcli.plugins'):
+    __import__(plug_mod)
 
 _app_name = 'acd_cli'
 
@@ -200,11 +222,16 @@ def old_sync() -> 'Union[int, None]':
     global cache
     cache.drop_all()
     cache = db.NodeCache(CACHE_PATH)
+
+    # the paginated listings are independent of each other
+    listings = [acd_client.get_folder_list, acd_client.get_trashed_folders,
+                acd_client.get_file_list, acd_client.get_trashed_files]
+    with ThreadPoolExecutor(max_workers=len(listings)) as executor:
+        futures = [executor.submit(listing) for listing in listings]
     try:
-        folders = acd_client.get_folder_list()
-        folders.extend(acd_client.get_trashed_folders())
-        files = acd_client.get_file_list()
-        files.extend(acd_client.get_trashed_files())
+        folders, trashed_folders, files, trashed_files = [f.result() for f in futures]
+        folders.extend(trashed_folders)
+        files.extend(trashed_files)
     except RequestError as e:
         logger.error(e)
         logger.critical('Sync failed.')
@@ -242,19 +269,20 @@ def partial_sync(path: str, recursive: bool) -> 'Union[int|None]':
     try:
         children = acd_client.list_children(fid)
         if recursive:
-            recursive_insert(children)
-        else:
-            cache.insert_nodes(children)
+            children = recursive_list(children)
+        cache.insert_nodes(children)
     except RequestError as e:
         logger.error("Sync failed: %s" % e)
         return ERROR_RETVAL
 
 
-def recursive_insert(nodes: 'List[dict]'):
-    cache.insert_nodes(nodes)
+def recursive_list(nodes: 'List[dict]') -> 'List[dict]':
+    """Collects *nodes* and all of their folders' descendants for insertion in one batch."""
+    all_nodes = list(nodes)
     for n in nodes:
         if n['kind'] == 'FOLDER':
-            recursive_insert(acd_client.list_children(n['id']))
+            all_nodes.extend(recursive_list(acd_client.list_children(n['id'])))
+    return all_nodes
 
 
 def autosync(interval: int, stop: Event = None):
@@ -334,6 +362,21 @@ def compare_sizes(size1: int, size2: int, file_name: str) -> int:
     return 0
 
 
+def is_unchanged(st: os.stat_result, node: 'Node') -> bool:
+    """Checks whether a local file with status *st* can be considered uploaded
+    as the remote file *node*, i.e. whether sizes match and the remote file is not older."""
+    return (node.is_file and node.size == st.st_size
+            and datetime_to_timestamp(node.modified) >= st.st_mtime)
+
+
+def skips_dedup(name: str, st: os.stat_result, node: 'Node', force: bool, rsf: bool) -> bool:
+    """Checks whether the upload of local file *name* with status *st* need not be hashed
+    for deduplication, because it is unchanged compared to the conflicting remote *node*,
+    which can be taken as its duplicate. Files to be removed are always hashed."""
+    return (node is not None and node.name == name and not force and not rsf
+            and is_unchanged(st, node))
+
+
 def remove_file(path: str) -> int:
     try:
         os.remove(path)
@@ -347,10 +390,11 @@ def remove_file(path: str) -> int:
 
 def upload_complete(node: dict, path: str, hash_: str, size_: int, rsf: bool) -> int:
     cache.insert_node(node)
-    node = cache.get_node(node['id'])
+    props = node.get('contentProperties', {})
 
-    match = (compare_hashes(hash_, node.md5, path) |
-             compare_sizes(size_, node.size, path) if size_ is not None else 0)
+    # same defaults as the cache applies to empty files
+    match = (compare_hashes(hash_, props.get('md5', 'd41d8cd98f00b204e9800998ecf8427e'), path) |
+             compare_sizes(size_, props.get('size', 0), path) if size_ is not None else 0)
     if match != 0:
         return match
 
@@ -415,18 +459,31 @@ def download_complete(node: 'Node', path: str, hash_: str, rsf: bool):
 #
 
 
-def create_upload_jobs(dirs: list, path: str, parent_id: str, overwr: bool, force: bool,
-                       dedup: bool, rsf: bool, exclude: list, exclude_paths: list, jobs: list) \
-        -> int:
+def create_upload_jobs(dirs: set, path: str, parent_id: str, overwr: bool, force: bool,
+                       dedup: bool, rsf: bool, exclude: list, exclude_paths: set,
+                       ql: QueuedLoader, hashed: 'Tuple[str, int, int]' = None,
+                       entry: 'os.DirEntry' = None,
+                       siblings: 'Dict[str, Node]' = None, subdirs: 'deque' = None) -> int:
     """Creates upload job if passed path is a file, delegates directory traversal otherwise.
     Detects soft links that link to an already queued directory.
 
-    :param dirs: list of directories' inodes traversed so far
+    :param dirs: set of directories' inodes traversed so far
     :param rsf: remove source files
     :param exclude: list of file exclusion patterns
-    :param exclude_paths: list of paths for file or directory exclusion"""
-
-    if os.path.realpath(path) in [os.path.realpath(p) for p in exclude_paths]:
+    :param exclude_paths: set of real paths for file or directory exclusion
+    :param ql: loader the upload jobs are queued into
+    :param hashed: MD5, size and modification time (ns) of the file
+     as hashed for deduplication, if available
+    :param entry: directory entry of *path*, if available, to save on stat calls
+    :param siblings: prefetched conflicting nodes of the parent folder, see
+     :meth:`get_conflicting_nodes <acdcli.cache.query.QueryMixin.get_conflicting_nodes>`;
+     names not contained are only looked up in the cache on a retry or a name collision
+    :param subdirs: if given, directories are appended to it as (path, parent ID)
+     instead of being traversed right away"""
+
+    # entries are joined to the real path of their directory
+    real_path = path if entry and not entry.is_symlink() else os.path.realpath(path)
+    if real_path in exclude_paths:
         logger.info('Skipping upload of path "%s".' % path)
         return 0
 
@@ -434,24 +491,34 @@ def create_upload_jobs(dirs: list, path: str, parent_id: str, overwr: bool, forc
         logger.error('Path "%s" is not accessible.' % path)
         return INVALID_ARG_RETVAL
 
-    if os.path.isdir(path):
-        ino = os.stat(path).st_ino
+    if entry:
+        is_dir, is_file = entry.is_dir(), entry.is_file()
+    else:
+        is_dir, is_file = os.path.isdir(path), os.path.isfile(path)
+
+    if is_dir:
+        ino = (entry.stat() if entry else os.stat(path)).st_ino
         if ino in dirs:
             logger.warning('Duplicate directory detected: "%s".' % path)
             return DUPLICATE_DIR
-        dirs.append(ino)
+        dirs.add(ino)
+        if subdirs is not None:
+            subdirs.append((path, parent_id))
+            return 0
         return traverse_ul_dir(dirs, path, parent_id, overwr, force, dedup,
-                               rsf, exclude, exclude_paths, jobs)
-    elif os.path.isfile(path):
+                               rsf, exclude, exclude_paths, ql)
+    elif is_file:
         short_nm = os.path.basename(path)
         for reg in exclude:
             if re.match(reg, short_nm):
                 logger.info('Skipping upload of "%s" because of exclusion pattern.' % short_nm)
                 return 0
 
-        prog = progress.FileProgress(os.path.getsize(path))
-        fo = partial(upload_file, path, parent_id, overwr, force, dedup, rsf, pg_handler=prog)
-        jobs.append(fo)
+        # the file is stat'ed again when uploading, it may change in the meantime
+        prog = progress.FileProgress((entry.stat() if entry else os.stat(path)).st_size)
+        fo = partial(upload_file, path, parent_id, overwr, force, dedup, rsf, hashed=hashed,
+                     siblings=siblings, pg_handler=prog)
+        ql.add_jobs([fo])
         return 0
 
     else:
@@ -459,17 +526,39 @@ def create_upload_jobs(dirs: list, path: str, parent_id: str, overwr: bool, forc
         return INVALID_ARG_RETVAL
 
 
-def traverse_ul_dir(dirs: list, directory: str, parent_id: str, overwr: bool, force: bool,
-                    dedup: bool, rsf: bool, exclude: list, exclude_paths: list, jobs: list) -> int:
-    """Duplicates local directory structure."""
+def traverse_ul_dir(dirs: set, directory: str, parent_id: str, overwr: bool, force: bool,
+                    dedup: bool, rsf: bool, exclude: list, exclude_paths: set,
+                    ql: QueuedLoader) -> int:
+    """Duplicates local directory structure. The tree is walked breadth-first,
+    so the remote folders of one level are created before those of the next."""
+
+    ret_val = 0
+    pending = deque([(directory, parent_id)])
+    folders = {}
+    while pending:
+        directory, parent_id = pending.popleft()
+        ret_val |= upload_dir_entries(dirs, directory, parent_id, overwr, force, dedup,
+                                      rsf, exclude, exclude_paths, ql, pending, folders)
+    return ret_val
+
+
+def upload_dir_entries(dirs: set, directory: str, parent_id: str, overwr: bool, force: bool,
+                       dedup: bool, rsf: bool, exclude: list, exclude_paths: set,
+                       ql: QueuedLoader, subdirs: 'deque', folders: 'Dict[str, Node]') -> int:
+    """Creates the remote folder for *directory* and the upload jobs of its files.
+    Subdirectories are appended to *subdirs*.
+
+    :param folders: remote folders of the current traversal by ID; the folder of
+     *directory* is added, so that its subdirectories need not look it up again"""
 
     if parent_id is None:
         parent_id = cache.get_root_id()
-    parent = cache.get_node(parent_id)
+    parent = folders.get(parent_id) or cache.get_node(parent_id)
 
     real_path = os.path.realpath(directory)
     short_nm = os.path.basename(real_path)
 
+    siblings = None
     curr_node = cache.get_child(parent_id, short_nm)
     if not curr_node or not curr_node.is_available or not parent.is_available:
         try:
@@ -477,6 +566,7 @@ def traverse_ul_dir(dirs: list, directory: str, parent_id: str, overwr: bool, fo
             logger.info('Created folder "%s"' % (cache.first_path(parent.id) + short_nm))
             cache.insert_node(r)
             curr_node = cache.get_node(r['id'])
+            siblings = {}
         except RequestError as e:
             if e.status_code == 409:
                 logger.error('Folder "%s" already exists. Please sync.' % short_nm)
@@ -489,28 +579,76 @@ def traverse_ul_dir(dirs: list, directory: str, parent_id: str, overwr: bool, fo
         return ERR_CR_FOLDER
 
     try:
-        entries = sorted(os.listdir(directory))
+        entries = sorted(scandir(directory), key=lambda e: e.name)
     except OSError as e:
         logger.error('Skipping directory %s because of an error.' % directory)
         logger.info(e)
         return ERROR_RETVAL
 
+    if siblings is None:
+        siblings = cache.get_conflicting_nodes(curr_node.id)
+    # source files are only removed on a match of a hash taken right before
+    hashes = hash_dedup_candidates(real_path, entries, exclude, siblings, force) \
+        if dedup and not rsf else {}
+
     ret_val = 0
     for entry in entries:
-        full_path = os.path.join(real_path, entry)
+        full_path = os.path.join(real_path, entry.name)
         ret_val |= create_upload_jobs(dirs, full_path, curr_node.id,
-                                      overwr, force, dedup, rsf, exclude, exclude_paths, jobs)
+                                      overwr, force, dedup, rsf, exclude, exclude_paths, ql,
+                                      hashes.get(full_path), entry, siblings, subdirs)
 
+    folders[curr_node.id] = curr_node
     return ret_val
 
 
+def hash_dedup_candidates(directory: str, entries: 'List[os.DirEntry]', exclude: list,
+                          siblings: 'Dict[str, Node]', force: bool) -> dict:
+    """Concurrently hashes the files in *directory* that may have a remote duplicate,
+    i.e. that have the size of a cached file. Files that :func:`upload_file` would not
+    hash for deduplication (see :func:`skips_dedup`) are skipped.
+
+    :returns: dict of path to MD5, size and modification time (ns) before hashing"""
+
+    candidates = {}
+    for entry in entries:
+        if not entry.is_file() or any(re.match(reg, entry.name) for reg in exclude):
+            continue
+        st = entry.stat()
+        if skips_dedup(entry.name, st, siblings.get(entry.name.lower()), force, False):
+            continue
+        if cache.file_size_exists(st.st_size):
+            candidates[os.path.join(directory, entry.name)] = st
+
+    md5s = hashing.hash_files(list(candidates))
+    return {path: (md5, candidates[path].st_size, candidates[path].st_mtime_ns)
+            for path, md5 in md5s.items()}
+
+
 @retry_on(STD_RETRY_RETVALS)
 def upload_file(path: str, parent_id: str, overwr: bool, force: bool, dedup: bool, rsf: bool,
+                hashed: 'Tuple[str, int, int]' = None, siblings: 'Dict[str, Node]' = None,
                 pg_handler: progress.FileProgress = None) -> RetryRetVal:
     short_nm = os.path.basename(path)
+    st = os.stat(path)
+
+    # a retry may find a node inserted by the failed attempt, which the snapshot predates
+    if siblings is not None and pg_handler.status is None:
+        conflicting_node = siblings.get(short_nm.lower())
+    else:
+        conflicting_node = cache.get_conflicting_node(short_nm, parent_id)
 
-    if dedup and cache.file_size_exists(os.path.getsize(path)):
-        nodes = cache.find_by_md5(hashing.hash_file(path))
+    if dedup and cache.file_size_exists(st.st_size):
+        if skips_dedup(short_nm, st, conflicting_node, force, rsf):
+            # an unchanged existing file is its own duplicate, no need to read it
+            nodes = [conflicting_node]
+        else:
+            # the file may have changed since it was hashed during traversal
+            if hashed and hashed[1:] == (st.st_size, st.st_mtime_ns):
+                md5 = hashed[0]
+            else:
+                md5 = hashing.hash_file(path)
+            nodes = cache.find_by_md5(md5)
         nodes = [n for n in cache.path_format(nodes)]
         if len(nodes) > 0:
             logger.info('Skipping upload of duplicate file "%s". Location of duplicates: %s' % (short_nm, nodes))
@@ -519,55 +657,69 @@ def upload_file(path: str, parent_id: str, overwr: bool, force: bool, dedup: boo
                 return remove_file(path)
             return DUPLICATE
 
-    conflicting_node = cache.get_conflicting_node(short_nm, parent_id)
-    file_id = None
     if conflicting_node:
-        if conflicting_node.name != short_nm:
-            logger.error('File name "%s" collides with remote node "%s".'
-                         % (short_nm, conflicting_node.name))
-            return NAME_COLLISION
-
-        if conflicting_node.is_folder:
-            logger.error('Name collision with existing folder '
-                         'in the same location: "%s".' % short_nm)
-            return NAME_COLLISION
-
-        file_id = conflicting_node.id
-
-    if not file_id:
-        logger.info('Uploading %s' % path)
-        hasher = hashing.IncrementalHasher()
-        local_size = os.path.getsize(path)
-        try:
-            r = acd_client.upload_file(path, parent_id,
-                                       read_callbacks=[hasher.update, pg_handler.update],
-                                       deduplication=dedup)
-        except RequestError as e:
-            if e.status_code == 409:  # might happen if cache is outdated
-                if not dedup:
-                    logger.error('Uploading "%s" failed. Name collision with non-cached file. '
-                                 'If you want to overwrite, please sync and try again.' % short_nm)
-                else:
-                    logger.error(
-                        'Uploading "%s" failed. '
-                        'Name or hash collision with non-cached file.' % short_nm)
-                    logger.info(e)
-                # colliding node ID is returned in error message -> could be used to continue
-                return CACHE_ASYNC
-            elif e.status_code == 504 or e.status_code == 408:  # proxy timeout / request timeout
-                return upload_timeout(parent_id, path, hasher.get_result(), local_size, rsf)
+        return upload_conflicting(path, st, conflicting_node, overwr, force, dedup, rsf,
+                                  pg_handler)
+
+    logger.info('Uploading %s' % path)
+    # the uploaded bytes are hashed even if the file was hashed for deduplication,
+    # so that the remote hash is verified against what was actually sent
+    hasher = hashing.ThreadedHasher()
+    local_size = st.st_size
+    try:
+        r = acd_client.upload_file(path, parent_id,
+                                   read_callbacks=[hasher.update, pg_handler.update],
+                                   deduplication=dedup)
+    except RequestError as e:
+        if e.status_code == 409:  # might happen if cache is outdated
+            # the node may have been cached since the snapshot of the folder was taken
+            conflicting_node = cache.get_conflicting_node(short_nm, parent_id)
+            if conflicting_node:
+                pg_handler.reset()
+                return upload_conflicting(path, st, conflicting_node, overwr, force,
+                                          dedup, rsf, pg_handler)
+            if not dedup:
+                logger.error('Uploading "%s" failed. Name collision with non-cached file. '
+                             'If you want to overwrite, please sync and try again.' % short_nm)
             else:
-                logger.error('Uploading "%s" failed. %s.' % (short_nm, str(e)))
-                return UL_DL_FAILED
+                logger.error(
+                    'Uploading "%s" failed. '
+                    'Name or hash collision with non-cached file.' % short_nm)
+                logger.info(e)
+            # colliding node ID is returned in error message -> could be used to continue
+            return CACHE_ASYNC
+        elif e.status_code == 504 or e.status_code == 408:  # proxy timeout / request timeout
+            return upload_timeout(parent_id, path, hasher.get_result(), local_size, rsf)
         else:
-            return upload_complete(r, path, hasher.get_result(), local_size, rsf)
+            logger.error('Uploading "%s" failed. %s.' % (short_nm, str(e)))
+            return UL_DL_FAILED
+    else:
+        return upload_complete(r, path, hasher.get_result(), local_size, rsf)
 
-    # else: file exists
+
+def upload_conflicting(path: str, st: os.stat_result, conflicting_node: 'Node', overwr: bool,
+                       force: bool, dedup: bool, rsf: bool,
+                       pg_handler: progress.FileProgress) -> int:
+    """Skips or overwrites the remote node of the same name as local file *path*,
+    whose status is *st*."""
+
+    short_nm = os.path.basename(path)
+    if conflicting_node.name != short_nm:
+        logger.error('File name "%s" collides with remote node "%s".'
+                     % (short_nm, conflicting_node.name))
+        return NAME_COLLISION
+
+    if conflicting_node.is_folder:
+        logger.error('Name collision with existing folder '
+                     'in the same location: "%s".' % short_nm)
+        return NAME_COLLISION
+
+    file_id = conflicting_node.id
 
     rmod = datetime_to_timestamp(conflicting_node.modified)
     rmod = datetime.utcfromtimestamp(rmod)
-    lmod = datetime.utcfromtimestamp(os.path.getmtime(path))
-    lcre = datetime.utcfromtimestamp(os.path.getctime(path))
+    lmod = datetime.utcfromtimestamp(st.st_mtime)
+    lcre = datetime.utcfromtimestamp(st.st_ctime)
 
     logger.debug('Remote mtime: %s, local mtime: %s, local ctime: %s' % (rmod, lmod, lcre))
 
@@ -578,7 +730,7 @@ def upload_file(path: str, parent_id: str, overwr: bool, force: bool, dedup: boo
         if not rsf:
             return 0
 
-        if not compare_sizes(os.path.getsize(path), conflicting_node.size, short_nm):
+        if not compare_sizes(st.st_size, conflicting_node.size, short_nm):
             return remove_file(path)
 
         logger.info('Keeping "%s" because of remote size mismatch.' % path)
@@ -586,7 +738,7 @@ def upload_file(path: str, parent_id: str, overwr: bool, force: bool, dedup: boo
 
 
     # ctime is checked because files can be overwritten by files with older mtime
-    if rmod < lmod or (rmod < lcre and conflicting_node.size != os.path.getsize(path)) \
+    if rmod < lmod or (rmod < lcre and conflicting_node.size != st.st_size) \
             or force:
         return overwrite(file_id, path, dedup=dedup, rsf=rsf, pg_handler=pg_handler).ret_val
     elif not force:
@@ -598,7 +750,7 @@ def upload_file(path: str, parent_id: str, overwr: bool, force: bool, dedup: boo
 @retry_on(STD_RETRY_RETVALS)
 def overwrite(node_id: str, local_file: str, dedup=False, rsf=False,
               pg_handler: progress.FileProgress = None) -> RetryRetVal:
-    hasher = hashing.IncrementalHasher()
+    hasher = hashing.ThreadedHasher()
     local_size = os.path.getsize(local_file)
 
     initial_node = acd_client.get_metadata(node_id)
@@ -622,7 +774,7 @@ def overwrite(node_id: str, local_file: str, dedup=False, rsf=False,
 @retry_on([])
 def upload_stream(stream, file_name, parent_id, overwr=False, dedup=False,
                   pg_handler: progress.FileProgress = None) -> RetryRetVal:
-    hasher = hashing.IncrementalHasher()
+    hasher = hashing.ThreadedHasher()
     child = cache.get_child(parent_id, file_name)
     log_fname = 'stream/' + file_name
 
@@ -652,18 +804,21 @@ def upload_stream(stream, file_name, parent_id, overwr=False, dedup=False,
 
 
 def create_dl_jobs(node_id: str, local_path: str, preserve_mtime: bool, rsf: bool,
-                   exclude: 'List[re._pattern_type]', jobs: list) -> int:
-    """Appends download partials for folder/file node pointed to by *node_id*
-    to the **jobs** list."""
+                   exclude: 'List[re._pattern_type]', ql: QueuedLoader, node: 'Node' = None) -> int:
+    """Queues download partials for folder/file node pointed to by *node_id*
+    into the loader **ql**.
+
+    :param node: the node with ID *node_id*, if already fetched"""
 
     local_path = local_path if local_path else ''
 
-    node = cache.get_node(node_id)
+    if not node:
+        node = cache.get_node(node_id)
     if not node.is_available:
         return 0
 
     if node.is_folder:
-        return traverse_dl_folder(node, local_path, preserve_mtime, rsf, exclude, jobs)
+        return traverse_dl_folder(node, local_path, preserve_mtime, rsf, exclude, ql)
 
     loc_name = node.name
 
@@ -681,50 +836,59 @@ def create_dl_jobs(node_id: str, local_path: str, preserve_mtime: bool, rsf: boo
         return 0
 
     prog = progress.FileProgress(node.size)
-    fo = partial(download_file, node_id, local_path, preserve_mtime, rsf, pg_handler=prog)
-    jobs.append(fo)
+    fo = partial(download_file, node_id, local_path, preserve_mtime, rsf, node=node,
+                 pg_handler=prog)
+    ql.add_jobs([fo])
 
     return 0
 
 
 def traverse_dl_folder(node: 'Node', local_path: str, preserve_mtime: bool, rsf: bool,
-                       exclude: 'List[re._pattern_type', jobs: list) -> int:
-    """Duplicates remote folder structure."""
+                       exclude: 'List[re._pattern_type', ql: QueuedLoader) -> int:
+    """Duplicates remote folder structure. The folder tree is walked breadth-first,
+    queueing the download jobs of a folder's files before descending further."""
 
     if not local_path:
         local_path = os.getcwd()
 
-    if node.name is None:
-        curr_path = os.path.join(local_path, 'acd')
-    else:
-        curr_path = os.path.join(local_path, node.name)
+    ret_val = 0
+    pending = deque([(node, local_path)])
+    while pending:
+        node, local_path = pending.popleft()
 
-    try:
-        os.makedirs(curr_path, exist_ok=True)
-    except OSError:
-        logger.error('Error creating directory "%s".' % curr_path)
-        return ERR_CR_FOLDER
+        if node.name is None:
+            curr_path = os.path.join(local_path, 'acd')
+        else:
+            curr_path = os.path.join(local_path, node.name)
 
-    ret_val = 0
-    folders, files = cache.list_children(node.id)
-    folders, files = sorted(folders), sorted(files)
+        try:
+            os.makedirs(curr_path, exist_ok=True)
+        except OSError:
+            logger.error('Error creating directory "%s".' % curr_path)
+            ret_val |= ERR_CR_FOLDER
+            continue
+
+        folders, files = cache.list_children(node.id)
+        folders, files = sorted(folders), sorted(files)
+
+        for file in files:
+            ret_val |= create_dl_jobs(file.id, curr_path, preserve_mtime, rsf, exclude, ql, file)
+        pending.extend((folder, curr_path) for folder in folders)
 
-    for file in files:
-        ret_val |= create_dl_jobs(file.id, curr_path, preserve_mtime, rsf, exclude, jobs)
-    for folder in folders:
-        ret_val |= traverse_dl_folder(folder, curr_path, preserve_mtime, rsf, exclude, jobs)
     return ret_val
 
 
 @retry_on(DL_RETRY_RETVALS)
 def download_file(node_id: str, local_path: str, preserve_mtime: bool, rsf: bool,
-                  pg_handler: progress.FileProgress = None) -> RetryRetVal:
-    node = cache.get_node(node_id)
+                  node: 'Node' = None, pg_handler: progress.FileProgress = None) -> RetryRetVal:
+    """:param node: the node with ID *node_id*, if already fetched"""
+    if not node:
+        node = cache.get_node(node_id)
     name, md5, size = node.name, node.md5, node.size
 
     logger.info('Downloading "%s".' % name)
 
-    hasher = hashing.IncrementalHasher()
+    hasher = hashing.ThreadedHasher()
     try:
         acd_client.download_file(node_id, name, local_path, length=size,
                                  write_callbacks=[hasher.update, pg_handler.update])
@@ -831,7 +995,7 @@ def tree_action(args: argparse.Namespace):
         logger.critical('Invalid folder.')
         return INVALID_ARG_RETVAL
 
-    for line in cache.tree_format(node, args.node_path, trash=args.include_trash,
+    for line in cache.tree_format(node, str(args.node_path), trash=args.include_trash,
                                   dir_only=args.dir_only, max_depth=args.max_depth):
         print(line)
 
@@ -871,8 +1035,12 @@ def upload_action(args: argparse.Namespace) -> int:
         return INVALID_ARG_RETVAL
 
     excl_re = regex_helper(args)
+    excl_paths = {os.path.realpath(p) for p in args.exclude_path}
+
+    # workers pick up file jobs while remote folders are still being created
+    ql = QueuedLoader(args.max_connections, args.print_progress, max_retries=args.max_retries)
+    ql.start_workers()
 
-    jobs = []
     ret_val = 0
     for path in args.path:
         if not os.path.exists(path):
@@ -880,14 +1048,11 @@ def upload_action(args: argparse.Namespace) -> int:
             ret_val |= INVALID_ARG_RETVAL
             continue
 
-        ret_val |= create_upload_jobs([], path, args.parent, args.overwrite, args.force,
+        ret_val |= create_upload_jobs(set(), path, args.parent, args.overwrite, args.force,
                                       args.deduplicate, args.remove_source_files,
-                                      excl_re, args.exclude_path, jobs)
-
-    ql = QueuedLoader(args.max_connections, args.print_progress, max_retries=args.max_retries)
-    ql.add_jobs(jobs)
+                                      excl_re, excl_paths, ql)
 
-    return ret_val | ql.start()
+    return ret_val | ql.join()
 
 
 @no_autores_trash_action
@@ -922,15 +1087,13 @@ def overwrite_action(args: argparse.Namespace) -> int:
 def download_action(args: argparse.Namespace) -> int:
     excl_re = regex_helper(args)
 
-    jobs = []
-    ret_val = 0
-    ret_val |= create_dl_jobs(args.node, args.path, args.times, args.remove_source_files,
-                              excl_re, jobs)
-
     ql = QueuedLoader(args.max_connections, args.print_progress, args.max_retries)
-    ql.add_jobs(jobs)
+    ql.start_workers()
+
+    ret_val = create_dl_jobs(args.node, args.path, args.times, args.remove_source_files,
+                             excl_re, ql)
 
-    return ret_val | ql.start()
+    return ret_val | ql.join()
 
 
 def cat_action(args: argparse.Namespace) -> int:
@@ -1167,33 +1330,53 @@ def unmount_action(args: argparse.Namespace):
 #
 
 
+class LazyPath(object):
+    """Stand-in for a node's first path that walks the node's ancestry on first use only."""
+
+    def __init__(self, node_id: str):
+        self.node_id = node_id
+        self._path = None
+
+    def __str__(self):
+        if self._path is None:
+            self._path = cache.first_path(self.node_id)
+        return self._path
+
+
 def resolve_remote_path_args(args: argparse.Namespace, attrs: list, incl_trash: bool = True):
     """In-place replaces certain attributes in Namespace by resolved node ID.
+    The path of a node given by ID is stored as :class:`LazyPath`.
+
     :param attrs: list of attributes that may be given in absolute path form
     :param incl_trash: whether to resolve trashed files"""
 
+    vals = {id_attr: getattr(args, id_attr) for id_attr in attrs
+            if getattr(args, id_attr, None)}
+    paths = {id_attr: '/' + '/'.join(list(filter(bool, val.split('/'))))
+             for id_attr, val in vals.items() if '/' in val}
+    resolved = cache.resolve_paths(paths.values(), trash=incl_trash) if paths else {}
+
     for id_attr in attrs:
-        if hasattr(args, id_attr):
-            val = getattr(args, id_attr)
-            if not val:
-                continue
-            if '/' in val:
-                val = '/' + '/'.join(list(filter(bool, val.split('/'))))
-                v = cache.resolve(val, trash=incl_trash)
-                if not v:
-                    logger.critical('Could not resolve path "%s".' % val)
-                    sys.exit(INVALID_ARG_RETVAL)
-                logger.info('Resolved "%s" to "%s"' % (val, v))
-                setattr(args, id_attr, v.id)
-                setattr(args, id_attr + '_path', val)
-            elif is_valid_id(val):
-                if not cache.get_node(val):
-                    logger.critical('Cannot find node with ID "%s".' % val)
-                    sys.exit(INVALID_ARG_RETVAL)
-                setattr(args, id_attr + '_path', cache.first_path(val))
-            else:
-                logger.critical('Invalid ID format: "%s".' % val)
+        if id_attr not in vals:
+            continue
+        val = vals[id_attr]
+        if id_attr in paths:
+            val = paths[id_attr]
+            v = resolved.get(val)
+            if not v:
+                logger.critical('Could not resolve path "%s".' % val)
+                sys.exit(INVALID_ARG_RETVAL)
+            logger.info('Resolved "%s" to "%s"' % (val, v))
+            setattr(args, id_attr, v.id)
+            setattr(args, id_attr + '_path', val)
+        elif is_valid_id(val):
+            if not cache.get_node(val):
+                logger.critical('Cannot find node with ID "%s".' % val)
                 sys.exit(INVALID_ARG_RETVAL)
+            setattr(args, id_attr + '_path', LazyPath(val))
+        else:
+            logger.critical('Invalid ID format: "%s".' % val)
+            sys.exit(INVALID_ARG_RETVAL)
 
 
 def set_log_level(args: argparse.Namespace):
@@ -1642,6 +1825,7 @@ def main():
     conf = get_conf(SETTINGS_PATH, _SETTINGS_FILENAME, def_conf)
 
     if args.func not in offline_actions:
+        from acdcli.api import client
         try:
             acd_client = client.ACDClient(CACHE_PATH, SETTINGS_PATH)
         except:
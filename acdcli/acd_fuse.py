@@ -7,11 +7,9 @@ import os
 import stat
 import sys
 
-from collections import deque, defaultdict
-from multiprocessing import Process
-from queue import Queue, Full as QueueFull
-from threading import Thread, Lock, Event
-from time import time, sleep
+from collections import deque, defaultdict, OrderedDict
+from threading import Thread, Lock, Event, Condition
+from time import time
 
 import ctypes.util
 ctypes.util.__find_library = ctypes.util.find_library
@@ -45,8 +43,11 @@ except:
 _SETTINGS_FILENAME = 'fuse.ini'
 
 _def_conf = configparser.ConfigParser()
-_def_conf['read'] = dict(open_chunk_limit=10, timeout=5)
+_def_conf['read'] = dict(open_chunk_limit=10, timeout=5,
+                         small_file_size=512 * 1024, small_file_cache_size=32 * 1024 ** 2,
+                         async_read=False)
 _def_conf['write'] = dict(buffer_size = 32, timeout=30)
+_def_conf['resolve'] = dict(cache_size=4096, cache_ttl=5)
 
 
 class FuseOSError(FuseError):
@@ -64,14 +65,14 @@ class FuseOSError(FuseError):
                     }
 
     @staticmethod
-    def convert(e: RequestError):
-        """:raises: FuseOSError"""
+    def convert(e: RequestError, caller: str = ''):
+        """:param caller: name of the failed operation to prefix the logged error with
+        :raises: FuseOSError"""
 
-        try:
-            caller = sys._getframe().f_back.f_code.co_name + ': '
-        except AttributeError:
-            caller = ''
-        logger.error(caller + e.__str__())
+        if caller:
+            logger.error('%s: %s', caller, e)
+        else:
+            logger.error('%s', e)
 
         try:
             exc = FuseOSError.code_mapping[e.status_code]
@@ -81,12 +82,22 @@ class FuseOSError(FuseError):
 
 
 class ReadProxy(object):
-    """Dict of stream chunks for consecutive read access of files."""
+    """Dict of stream chunks for consecutive read access of files.
+    Small files are downloaded at once and kept in memory instead."""
 
-    def __init__(self, acd_client, open_chunk_limit, timeout):
+    def __init__(self, acd_client, open_chunk_limit, timeout,
+                 small_file_size=0, small_file_cache_size=0):
         self.acd_client = acd_client
         self.lock = Lock()
         self.files = defaultdict(lambda: ReadProxy.ReadFile(open_chunk_limit, timeout))
+        self.timeout = timeout
+        self.small_file_size = small_file_size
+        """files up to this size are read in one request"""
+        self.small_files = OrderedDict()
+        """LRU map (id, md5)->content of small files"""
+        self.small_files_size = 0
+        """total size of :attr:`small_files`"""
+        self.small_file_cache_size = small_file_cache_size
 
     class StreamChunk(object):
         """StreamChunk represents a file node chunk as a streamed ranged HTTP response
@@ -94,6 +105,10 @@ class ReadProxy(object):
 
         __slots__ = ('offset', 'r', 'end')
 
+        MAX_SKIP = 512 * 1024
+        """maximal number of bytes to read and discard in order to reuse a chunk for a read
+        that begins further ahead, which is cheaper than requesting a new chunk"""
+
         def __init__(self, acd_client, id_, offset, length, **kwargs):
             self.offset = offset
             """the first byte position (fpos) available in the chunk"""
@@ -113,6 +128,12 @@ class ReadProxy(object):
                 return True
             return False
 
+        def has_byte_range_ahead(self, offset, length) -> bool:
+            """Tests whether chunk can skip at most :attr:`MAX_SKIP` bytes forward to **offset**
+            and then has at least **length** bytes remaining."""
+            return self.offset < offset <= self.offset + self.MAX_SKIP \
+                and offset + length - 1 <= self.end
+
         def get(self, length) -> bytes:
             """Gets *length* bytes beginning at current offset.
 
@@ -136,47 +157,81 @@ class ReadProxy(object):
         """Represents a file opened for reading.
         Encapsulates at most :attr:`MAX_CHUNKS_PER_FILE` open chunks."""
 
-        __slots__ = ('chunks', 'access', 'lock', 'timeout')
+        __slots__ = ('chunks', 'access', 'lock', 'timeout', 'closed')
 
         def __init__(self, open_chunk_limit, timeout):
             self.chunks = deque(maxlen=open_chunk_limit)
             self.access = time()
             self.lock = Lock()
             self.timeout = timeout
+            self.closed = False
 
         def get(self, acd_client, id_, offset, length, total) -> bytes:
-            """Gets a byte range from existing StreamChunks"""
+            """Gets a byte range from an existing StreamChunk or a new one.
+            Chunks are taken out of the deque while being read from, so that the lock is not
+            held during network I/O and concurrent reads of the file can proceed."""
 
             with self.lock:
-                i = len(self.chunks) - 1
-                while i >= 0:
-                    c = self.chunks[i]
-                    if c.has_byte_range(offset, length):
-                        try:
-                            bytes_ = c.get(length)
-                        except:
-                            self.chunks.remove(c)
-                        else:
-                            return bytes_
-                    i -= 1
+                chunk = self._take(offset, length)
+
+            if chunk:
+                try:
+                    if chunk.offset < offset:
+                        chunk.get(offset - chunk.offset)
+                    bytes_ = chunk.get(length)
+                except:
+                    chunk.close()
+                else:
+                    self._put(chunk)
+                    return bytes_
+
+            # request no more than the rest of the file, so the response can be read to the end
+            chunk_size = min(acd_client._conf.getint('transfer', 'dl_chunk_size'), total - offset)
 
             try:
-                with self.lock:
-                    chunk = ReadProxy.StreamChunk(acd_client, id_, offset,
-                                                  acd_client._conf.getint('transfer',
-                                                                          'dl_chunk_size'),
-                                                  timeout=self.timeout)
-                    if len(self.chunks) == self.chunks.maxlen:
-                        self.chunks[0].close()
-
-                    self.chunks.append(chunk)
-                    return chunk.get(length)
+                chunk = ReadProxy.StreamChunk(acd_client, id_, offset, chunk_size,
+                                              timeout=self.timeout)
             except RequestError as e:
-                FuseOSError.convert(e)
+                FuseOSError.convert(e, 'get')
+            try:
+                bytes_ = chunk.get(length)
+            except:
+                chunk.close()
+                raise
+            self._put(chunk)
+            return bytes_
+
+        def _take(self, offset, length) -> 'Union[ReadProxy.StreamChunk, None]':
+            """Removes and returns a chunk that can serve the byte range, preferring chunks that
+            begin exactly at **offset**. Must be called with :attr:`lock` held."""
+
+            for c in reversed(self.chunks):
+                if c.has_byte_range(offset, length):
+                    self.chunks.remove(c)
+                    return c
+
+            # small forward seeks, e.g. of media players, are served by skipping ahead
+            for c in reversed(self.chunks):
+                if c.has_byte_range_ahead(offset, length):
+                    self.chunks.remove(c)
+                    return c
+
+        def _put(self, chunk):
+            """Adds a chunk, closing the least recently added one if the limit is reached.
+            The chunk is closed instead if the file has been cleared in the meantime."""
+            with self.lock:
+                if self.closed:
+                    chunk.close()
+                    return
+                if len(self.chunks) == self.chunks.maxlen:
+                    self.chunks[0].close()
+                self.chunks.append(chunk)
 
         def clear(self):
-            """Closes chunks and clears chunk deque."""
+            """Closes chunks and clears chunk deque. Chunks still being read from
+            are closed when they are put back."""
             with self.lock:
+                self.closed = True
                 for chunk in self.chunks:
                     try:
                         chunk.close()
@@ -184,17 +239,51 @@ class ReadProxy(object):
                         pass
                 self.chunks.clear()
 
-    def get(self, id_, offset, length, total):
+    def get(self, id_, offset, length, total, md5=None):
+        """:param md5: content hash, enables keeping small files in memory"""
+        if md5 and total <= self.small_file_size:
+            content = self._get_small_file(id_, md5, total)
+            return content[offset:offset + length]
+
         with self.lock:
             f = self.files[id_]
         return f.get(self.acd_client, id_, offset, length, total)
 
+    def _get_small_file(self, id_, md5, total) -> bytes:
+        key = (id_, md5)
+        with self.lock:
+            content = self.small_files.get(key)
+            if content is not None:
+                self.small_files.move_to_end(key)
+                return content
+
+        try:
+            content = bytes(self.acd_client.download_chunk(id_, 0, total, timeout=self.timeout))
+        except RequestError as e:
+            FuseOSError.convert(e, 'get')
+
+        # a truncated download must not be served from memory until the cache is full
+        if len(content) != total:
+            logger.error('Downloaded %d of %d bytes of small file "%s".'
+                         % (len(content), total, id_))
+            raise FuseOSError(errno.EIO)
+
+        with self.lock:
+            if key not in self.small_files:
+                self.small_files[key] = content
+                self.small_files_size += len(content)
+            while self.small_files_size > self.small_file_cache_size:
+                _, evicted = self.small_files.popitem(last=False)
+                self.small_files_size -= len(evicted)
+        return content
+
     def invalidate(self):
         pass
 
     def release(self, id_):
+        # reads after the release are served by a new ReadFile
         with self.lock:
-            f = self.files.get(id_)
+            f = self.files.pop(id_, None)
         if f:
             f.clear()
 
@@ -208,14 +297,27 @@ class WriteProxy(object):
         self.files = defaultdict(lambda: WriteProxy.WriteStream(buffer_size, timeout))
 
     class WriteStream(object):
-        """A WriteStream is a binary file-like object that is backed by a Queue.
-        It will remember its current offset."""
+        """A WriteStream is a binary file-like object that is backed by two reusable buffers.
+        Writes are copied into the current buffer; its reader takes all pending data at once
+        by swapping the buffers, so that writer and reader only synchronize once per write
+        and once per read. It will remember its current offset."""
 
-        __slots__ = ('q', 'offset', 'error', 'closed', 'done', 'timeout')
+        BLOCK_SIZE = 128 * 1024
+        """maximal size of a FUSE write with big_writes, buffer capacity is counted in these"""
+
+        __slots__ = ('buf', 'spare', 'filled', 'capacity', 'cond', 'offset', 'error', 'closed',
+                     'done', 'timeout')
 
         def __init__(self, buffer_size, timeout):
-            self.q = Queue(maxsize=buffer_size)
-            """a queue that buffers written blocks"""
+            self.buf = bytearray()
+            """buffer that is currently written to"""
+            self.spare = bytearray()
+            """buffer that was last handed to the reader"""
+            self.filled = 0
+            """number of written bytes in :attr:`buf` that were not read yet"""
+            self.capacity = buffer_size * self.BLOCK_SIZE
+            self.cond = Condition()
+            """guards the buffers and :attr:`closed`, notified on every state change"""
             self.offset = 0
             """the beginning fpos"""
             self.error = False
@@ -226,50 +328,58 @@ class WriteProxy(object):
             self.timeout = timeout
 
         def write(self, data: bytes):
-            """Writes data into queue.
+            """Copies data into the current buffer, which grows up to :attr:`capacity`.
 
             :raises: FuseOSError on timeout"""
 
-            if self.error:
-                raise FuseOSError(errno.EREMOTEIO)
-            try:
-                self.q.put(data, timeout=self.timeout)
-            except QueueFull:
-                logger.error('Write timeout.')
-                raise FuseOSError(errno.ETIMEDOUT)
-            self.offset += len(data)
-
-        def read(self, ln=0) -> bytes:
-            """Returns as much byte data from queue as possible.
-            Returns empty bytestring (EOF) if queue is empty and file was closed.
+            ln = len(data)
+            with self.cond:
+                if not self.cond.wait_for(lambda: self.filled + ln <= self.capacity
+                                          or not self.filled or self.error, self.timeout):
+                    logger.error('Write timeout.')
+                    raise FuseOSError(errno.ETIMEDOUT)
+                if self.error:
+                    raise FuseOSError(errno.EREMOTEIO)
+                end = self.filled + ln
+                if end > len(self.buf):
+                    # replace instead of resizing, the reader may still hold a view on the buffer
+                    buf = bytearray(max(end, min(2 * len(self.buf), self.capacity)))
+                    buf[:self.filled] = memoryview(self.buf)[:self.filled]
+                    self.buf = buf
+                self.buf[self.filled:end] = data
+                self.filled = end
+                self.cond.notify_all()
+            self.offset += ln
+
+        def read(self, ln=0) -> 'Union[memoryview, bytes]':
+            """Returns a view of all pending byte data, waiting for data if there is none.
+            Returns empty bytestring (EOF) if no data is pending and file was closed.
+            The view is only valid until the next call, when its buffer is written to again.
 
             :raises: IOError"""
 
-            if self.error:
-                raise IOError(errno.EIO, errno.errorcode[errno.EIO])
-
-            if self.closed and self.q.empty():
-                return b''
-
-            b = [self.q.get()]
-            self.q.task_done()
-            while not self.q.empty():
-                b.append(self.q.get())
-                self.q.task_done()
+            with self.cond:
+                self.cond.wait_for(lambda: self.filled or self.closed or self.error)
+                if self.error:
+                    raise IOError(errno.EIO, errno.errorcode[errno.EIO])
+                if not self.filled:
+                    return b''
+                data = memoryview(self.buf)[:self.filled]
+                self.buf, self.spare = self.spare, self.buf
+                self.filled = 0
+                self.cond.notify_all()
 
-            return b''.join(b)
+            return data
 
         def flush(self):
-            """Waits until the queue is emptied.
+            """Waits until all pending data was read.
 
             :raises: FuseOSError"""
 
-            while True:
+            with self.cond:
+                self.cond.wait_for(lambda: not self.filled or self.error)
                 if self.error:
                     raise FuseOSError(errno.EREMOTEIO)
-                if self.q.empty():
-                    return
-                sleep(1)
 
         def close(self):
             """Sets the closed flag to signal 'EOF' to the read function.
@@ -277,16 +387,26 @@ class WriteProxy(object):
 
             :raises: FuseOSError"""
 
-            self.closed = True
-            # prevent read deadlock
-            self.q.put(b'')
+            with self.cond:
+                self.closed = True
+                self.cond.notify_all()
 
-            # wait until read is complete
-            while True:
+                # wait until read is complete
+                self.cond.wait_for(lambda: self.done.is_set() or self.error)
                 if self.error:
                     raise FuseOSError(errno.EREMOTEIO)
-                if self.done.wait(1):
-                    return
+
+        def set_error(self):
+            """Sets the error flag and wakes up all waiting writers, readers and flushers."""
+            with self.cond:
+                self.error = True
+                self.cond.notify_all()
+
+        def set_done(self):
+            """Triggers the :attr:`done` event and wakes up a waiting :meth:`close`."""
+            with self.cond:
+                self.done.set()
+                self.cond.notify_all()
 
     def write_n_sync(self, stream: WriteStream, node_id: str):
         """Try to overwrite file with id ``node_id`` with content from ``stream``.
@@ -297,11 +417,11 @@ class WriteProxy(object):
         try:
             r = self.acd_client.overwrite_stream(stream, node_id)
         except (RequestError, IOError) as e:
-            stream.error = True
+            stream.set_error()
             logger.error('Error writing node "%s". %s' % (node_id, str(e)))
         else:
             self.cache.insert_node(r)
-            stream.done.set()
+            stream.set_done()
 
     def write(self, node_id, fh, offset, bytes_):
         """Gets WriteStream from defaultdict. Creates overwrite thread if offset is 0,
@@ -314,7 +434,7 @@ class WriteProxy(object):
         if f.offset == offset:
             f.write(bytes_)
         else:
-            f.error = True  # necessary?
+            f.set_error()
             logger.error('Wrong offset for writing to fh %s.' % fh)
             raise FuseOSError(errno.ESPIPE)
 
@@ -372,8 +492,11 @@ class ACDFuse(LoggingMixIn, Operations):
     """FUSE filesystem operations class for Amazon Cloud Drive.
     See `<http://fuse.sourceforge.net/doxygen/structfuse__operations.html>`_."""
 
+    FREE_SPACE_TTL = 60
+    """seconds after which :meth:`statfs` recalculates the available disk space"""
+
     def __init__(self, **kwargs):
-        """Calculates ACD usage and starts autosync process.
+        """Calculates ACD usage and prepares autosync, which is started in :meth:`init`.
 
         :param kwargs: cache (NodeCache), acd_client (ACDClient), autosync (partial)"""
 
@@ -383,7 +506,9 @@ class ACDFuse(LoggingMixIn, Operations):
         conf = kwargs['conf']
 
         self.rp = ReadProxy(self.acd_client,
-                            conf.getint('read', 'open_chunk_limit'), conf.getint('read', 'timeout'))
+                            conf.getint('read', 'open_chunk_limit'), conf.getint('read', 'timeout'),
+                            conf.getint('read', 'small_file_size'),
+                            conf.getint('read', 'small_file_cache_size'))
         """collection of files opened for reading"""
         self.wp = WriteProxy(self.acd_client, self.cache,
                              conf.getint('write', 'buffer_size'), conf.getint('write', 'timeout'))
@@ -399,6 +524,11 @@ class ACDFuse(LoggingMixIn, Operations):
         """total disk space"""
         self.free = 0 if not total else total - self.cache.calculate_usage()
         """manually calculated available disk space"""
+        self.free_updated = time()
+        self.free_lock = Lock()
+        """held while the available disk space is recalculated in the background"""
+        self.stat = self._statfs_dict()
+        """filesystem statistics as returned by :meth:`statfs`"""
         self.fh = 1
         """file handle counter\n\n :type: int"""
         self.handles = {}
@@ -408,27 +538,74 @@ class ACDFuse(LoggingMixIn, Operations):
         self.nlinks = kwargs.get('nlinks', False)
         """whether to calculate the number of hardlinks for folders"""
 
+        self.resolved = OrderedDict()
+        """LRU map (path, trash)->(node, lookup time) of recent path lookups"""
+        self.resolved_gen = 0
+        """incremented on each invalidation of :attr:`resolved`"""
+        self.resolve_lock = Lock()
+        """lock for :attr:`resolved` and :attr:`resolved_gen`"""
+        self.resolve_cache_size = conf.getint('resolve', 'cache_size')
+        self.resolve_ttl = conf.getint('resolve', 'cache_ttl')
+        """seconds a lookup is reused for, bounds staleness caused by other writers to the cache"""
+
+        self.autosync = autosync
         self.destroyed = autosync.keywords['stop']
-        """:type: multiprocessing.Event"""
+        """:type: threading.Event"""
+
+    def init(self, path):
+        """Starts the autosync thread. Called once the filesystem is mounted, i.e. after
+        daemonizing, which only keeps the forking thread alive."""
 
-        p = Process(target=autosync)
-        p.start()
+        t = Thread(target=self.autosync)
+        t.daemon = True
+        t.start()
 
     def destroy(self, path):
         self.destroyed.set()
 
+    def _resolve(self, path: str, trash=False) -> 'Union[Node|None]':
+        """Resolves ``path`` using the node cache, reusing recent lookups.
+        Lookups that were in flight during an invalidation are not memoized."""
+
+        key = (path, trash)
+        now = time()
+        with self.resolve_lock:
+            entry = self.resolved.get(key)
+            if entry and now - entry[1] < self.resolve_ttl:
+                self.resolved.move_to_end(key)
+                return entry[0]
+            gen = self.resolved_gen
+
+        node = self.cache.resolve(path, trash)
+
+        with self.resolve_lock:
+            if gen == self.resolved_gen:
+                self.resolved[key] = (node, now)
+                self.resolved.move_to_end(key)
+                if len(self.resolved) > self.resolve_cache_size:
+                    self.resolved.popitem(last=False)
+        return node
+
+    def _invalidate(self):
+        """Discards all memoized path lookups. Must be called after modifying the node cache."""
+        with self.resolve_lock:
+            self.resolved.clear()
+            self.resolved_gen += 1
+
     def readdir(self, path, fh) -> 'List[str]':
         """Lists the path's contents.
 
         :raises: FuseOSError if path is not a node or path is not a folder"""
 
-        node = self.cache.resolve(path)
+        node = self._resolve(path)
         if not node:
             raise FuseOSError(errno.ENOENT)
         if not node.type == 'folder':
             raise FuseOSError(errno.ENOTDIR)
 
-        return [_ for _ in ['.', '..'] + [c for c in self.cache.childrens_names(node.id)]]
+        names = ['.', '..']
+        names.extend(self.cache.childrens_names(node.id))
+        return names
 
     def getattr(self, path, fh=None) -> dict:
         """Creates a stat-like attribute dict, see :manpage:`stat(2)`.
@@ -437,7 +614,7 @@ class ACDFuse(LoggingMixIn, Operations):
         if fh:
             node = self.handles[fh]
         else:
-            node = self.cache.resolve(path)
+            node = self._resolve(path)
         if not node:
             raise FuseOSError(errno.ENOENT)
 
@@ -461,7 +638,7 @@ class ACDFuse(LoggingMixIn, Operations):
         if fh:
             node = self.handles[fh]
         else:
-            node = self.cache.resolve(path, trash=False)
+            node = self._resolve(path, trash=False)
         if not node:
             raise FuseOSError(errno.ENOENT)
 
@@ -471,11 +648,28 @@ class ACDFuse(LoggingMixIn, Operations):
         if node.size < offset + length:
             length = node.size - offset
 
-        return self.rp.get(node.id, offset, length, node.size)
+        return self.rp.get(node.id, offset, length, node.size, node.md5)
 
     def statfs(self, path) -> dict:
-        """Gets some filesystem statistics as specified in :manpage:`stat(2)`."""
+        """Gets some filesystem statistics as specified in :manpage:`stat(2)`.
+        Outdated statistics are returned while they are being recalculated in the background."""
+
+        if self.total and time() - self.free_updated > self.FREE_SPACE_TTL \
+                and self.free_lock.acquire(False):
+            t = Thread(target=self._update_free)
+            t.daemon = True
+            t.start()
+        return self.stat
 
+    def _update_free(self):
+        try:
+            self.free = self.total - self.cache.calculate_usage()
+            self.stat = self._statfs_dict()
+        finally:
+            self.free_updated = time()
+            self.free_lock.release()
+
+    def _statfs_dict(self) -> dict:
         bs = 512 * 1024  # no effect?
         return dict(f_bsize=bs,
                     f_frsize=bs,
@@ -490,22 +684,22 @@ class ACDFuse(LoggingMixIn, Operations):
 
         :param mode: not used"""
 
-        name = os.path.basename(path)
-        ppath = os.path.dirname(path)
-        p = self.cache.resolve(ppath)
+        ppath, name = os.path.split(path)
+        p = self._resolve(ppath)
         if not p:
             raise FuseOSError(errno.ENOTDIR)
 
         try:
             r = self.acd_client.create_folder(name, p.id)
         except RequestError as e:
-            FuseOSError.convert(e)
+            FuseOSError.convert(e, 'mkdir')
         else:
             self.cache.insert_node(r)
+            self._invalidate()
 
     def _trash(self, path):
         logger.debug('trash %s' % path)
-        node = self.cache.resolve(path, False)
+        node = self._resolve(path, False)
 
         if not node:  # or not parent:
             raise FuseOSError(errno.ENOENT)
@@ -516,9 +710,10 @@ class ACDFuse(LoggingMixIn, Operations):
             # else:
             r = self.acd_client.move_to_trash(node.id)
         except RequestError as e:
-            FuseOSError.convert(e)
+            FuseOSError.convert(e, '_trash')
         else:
             self.cache.insert_node(r)
+            self._invalidate()
 
     def rmdir(self, path):
         """Moves a directory into ACD trash."""
@@ -534,18 +729,18 @@ class ACDFuse(LoggingMixIn, Operations):
         :param mode: not used
         :returns int: file handle"""
 
-        name = os.path.basename(path)
-        ppath = os.path.dirname(path)
-        p = self.cache.resolve(ppath, False)
+        ppath, name = os.path.split(path)
+        p = self._resolve(ppath, False)
         if not p:
             raise FuseOSError(errno.ENOTDIR)
 
         try:
             r = self.acd_client.create_file(name, p.id)
             self.cache.insert_node(r)
+            self._invalidate()
             node = self.cache.get_node(r['id'])
         except RequestError as e:
-            FuseOSError.convert(e)
+            FuseOSError.convert(e, 'create')
 
         with self.fh_lock:
             self.fh += 1
@@ -563,14 +758,14 @@ class ACDFuse(LoggingMixIn, Operations):
         if old == new:
             return
 
-        node = self.cache.resolve(old, False)
+        node = self._resolve(old, False)
         if not node:
             raise FuseOSError(errno.ENOENT)
 
-        new_bn, new_dn = os.path.basename(new), os.path.dirname(new)
-        old_bn, old_dn = os.path.basename(old), os.path.dirname(old)
+        new_dn, new_bn = os.path.split(new)
+        old_dn, old_bn = os.path.split(old)
 
-        existing = self.cache.resolve(new, False)
+        existing = self._resolve(new, False)
         if existing:
             if existing.is_file:
                 self._trash(new)
@@ -582,7 +777,7 @@ class ACDFuse(LoggingMixIn, Operations):
 
         if new_dn != old_dn:
             # odir_id = self.cache.resolve_path(old_dn, False)
-            ndir = self.cache.resolve(new_dn, False)
+            ndir = self._resolve(new_dn, False)
             if not ndir:
                 raise FuseOSError(errno.ENOTDIR)
             self._move(node.id, ndir.id)
@@ -591,17 +786,19 @@ class ACDFuse(LoggingMixIn, Operations):
         try:
             r = self.acd_client.rename_node(id, name)
         except RequestError as e:
-            FuseOSError.convert(e)
+            FuseOSError.convert(e, '_rename')
         else:
             self.cache.insert_node(r)
+            self._invalidate()
 
     def _move(self, id, new_folder):
         try:
             r = self.acd_client.move_node(id, new_folder)
         except RequestError as e:
-            FuseOSError.convert(e)
+            FuseOSError.convert(e, '_move')
         else:
             self.cache.insert_node(r)
+            self._invalidate()
 
     def open(self, path, flags) -> int:
         """Opens a file.
@@ -612,7 +809,7 @@ class ACDFuse(LoggingMixIn, Operations):
         if (flags & os.O_APPEND) == os.O_APPEND:
             raise FuseOSError(errno.EFAULT)
 
-        node = self.cache.resolve(path, False)
+        node = self._resolve(path, False)
         if not node:
             raise FuseOSError(errno.ENOENT)
         with self.fh_lock:
@@ -642,7 +839,7 @@ class ACDFuse(LoggingMixIn, Operations):
         if fh:
             node = self.handles[fh]
         else:
-            node = self.cache.resolve(path)
+            node = self._resolve(path)
         if not node:
             raise FuseOSError(errno.ENOENT)
 
@@ -650,9 +847,10 @@ class ACDFuse(LoggingMixIn, Operations):
             try:
                 r = self.acd_client.clear_file(node.id)
             except RequestError as e:
-                raise FuseOSError.convert(e)
+                raise FuseOSError.convert(e, 'truncate')
             else:
                 self.cache.insert_node(r)
+                self._invalidate()
         elif length > 0:
             if node.size != length:
                 raise FuseOSError(errno.ENOSYS)
@@ -663,10 +861,13 @@ class ACDFuse(LoggingMixIn, Operations):
         if fh:
             node = self.handles[fh]
         else:
-            node = self.cache.resolve(path, trash=False)
+            node = self._resolve(path, trash=False)
         if node:
+            written = fh in self.wp.files
             self.rp.release(node.id)
             self.wp.release(fh)
+            if written:
+                self._invalidate()
             with self.fh_lock:
                 del self.handles[fh]
         else:
@@ -705,7 +906,11 @@ def mount(path: str, args: dict, **kwargs) -> 'Union[int, None]':
         logger.critical('Mountpoint does not exist or already used.')
         return 1
 
-    opts = dict(auto_cache=True, sync_read=True)
+    args['conf'] = get_conf(args['settings_path'], _SETTINGS_FILENAME, _def_conf)
+
+    opts = dict(auto_cache=True)
+    if not args['conf'].getboolean('read', 'async_read'):
+        opts['sync_read'] = True
     if sys.platform.startswith('linux'):
         opts['big_writes'] = True
 
@@ -714,8 +919,6 @@ def mount(path: str, args: dict, **kwargs) -> 'Union[int, None]':
 
     kwargs.update(opts)
 
-    args['conf'] = get_conf(args['settings_path'], _SETTINGS_FILENAME, _def_conf)
-
     FUSE(ACDFuse(**args), path, subtype=ACDFuse.__name__, **kwargs)
 
 
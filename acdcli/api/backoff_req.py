@@ -4,6 +4,7 @@ import random
 import logging
 from threading import Lock, local
 
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
 
 from .common import *
@@ -17,12 +18,14 @@ class BackOffRequest(object):
     Caution: this catches all connection errors and may stall for a long time.
     It is necessary to init this module before use."""
 
-    def __init__(self, auth_callback: 'requests.auth.AuthBase', timeout: 'Tuple[int, int]', proxies: dict={}):
+    def __init__(self, auth_callback: 'requests.auth.AuthBase', timeout: 'Tuple[int, int]', proxies: dict={},
+                 pool_size: int=10):
         """:arg auth_callback: callable object that attaches auth info to a request
            :arg timeout: tuple of connection timeout and idle timeout \
                          (http://docs.python-requests.org/en/latest/user/advanced/#timeouts)
            :arg proxies: dict of protocol to proxy, \
                          see http://docs.python-requests.org/en/master/user/advanced/#proxies
+           :arg pool_size: number of kept-alive connections per host
         """
 
         self.auth_callback = auth_callback
@@ -30,6 +33,7 @@ class BackOffRequest(object):
         self.proxies = proxies
 
         self.__session = requests.session()
+        self.__session.mount('https://', HTTPAdapter(pool_maxsize=pool_size))
         self.__thr_local = local()
         self.__lock = Lock()
         self.__retries = 0
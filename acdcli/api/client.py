@@ -25,7 +25,9 @@ _SETTINGS_FILENAME = 'acd_client.ini'
 _def_conf = configparser.ConfigParser()
 _def_conf['endpoints'] = dict(filename='endpoint_data', validity_duration=259200)
 _def_conf['transfer'] = dict(fs_chunk_size=128 * 1024, dl_chunk_size=500 * 1024 ** 2,
-                             chunk_retries=1, connection_timeout=30, idle_timeout=60)
+                             dl_connections=1, dl_range_size=16 * 1024 ** 2,
+                             chunk_retries=1, connection_timeout=30, idle_timeout=60,
+                             connection_pool_size=32)
 _def_conf['proxies'] = dict()
 
 
@@ -49,7 +51,8 @@ class ACDClient(AccountMixin, ContentMixin, MetadataMixin, TrashMixin):
                             self._conf.getint('transfer', 'idle_timeout'))
         proxies = dict(self._conf['proxies'])
 
-        self.BOReq = BackOffRequest(self.handler, requests_timeout, proxies)
+        self.BOReq = BackOffRequest(self.handler, requests_timeout, proxies,
+                                    self._conf.getint('transfer', 'connection_pool_size'))
 
     @property
     def _endpoint_data_path(self):
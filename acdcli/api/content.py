@@ -5,6 +5,7 @@ import io
 import mimetypes
 from collections import OrderedDict
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import quote_plus
 from requests import Response
 from requests_toolbelt import MultipartEncoder
@@ -14,6 +15,10 @@ from .common import *
 PARTIAL_SUFFIX = '.__incomplete'
 """suffix (file ending) for incomplete files"""
 
+RANGED_PARTIAL_SUFFIX = '.__incomplete_ranged'
+"""suffix for incomplete files downloaded via concurrent ranged requests;
+these files are preallocated and therefore not resumable"""
+
 logger = logging.getLogger(__name__)
 
 
@@ -252,6 +257,20 @@ class ContentMixin(object):
 
         length = kwargs.get('length', 0)
         resume = kwargs.get('resume', True)
+        connections = self._conf.getint('transfer', 'dl_connections')
+        range_sz = self._conf.getint('transfer', 'dl_range_size')
+
+        if connections > 1 and length > range_sz \
+                and not (resume and os.path.isfile(part_path)):
+            ranged_path = dl_path + RANGED_PARTIAL_SUFFIX
+            self.ranged_download(node_id, ranged_path, length, connections, range_sz,
+                                 kwargs.get('write_callbacks'))
+            if os.path.isfile(dl_path):
+                logger.info('Deleting existing file "%s".' % dl_path)
+                os.remove(dl_path)
+            os.rename(ranged_path, dl_path)
+            return
+
         if resume and os.path.isfile(part_path):
             with open(part_path, 'ab') as f:
                 part_size = os.path.getsize(part_path)
@@ -287,6 +306,57 @@ class ContentMixin(object):
             os.remove(dl_path)
         os.rename(part_path, dl_path)
 
+    def ranged_download(self, node_id: str, path: str, length: int, connections: int,
+                        range_sz: int, write_callbacks: list = None):
+        """Downloads a file of known *length* into *path* using up to *connections*
+        concurrent ranged requests of *range_sz* bytes each.
+        Callbacks are called in file order as soon as a contiguous range is complete.
+
+        :raises: RequestError"""
+
+        chunk_sz = self._conf.getint('transfer', 'fs_chunk_size')
+        ranges = [(start, min(start + range_sz, length) - 1)
+                  for start in range(0, length, range_sz)]
+
+        with open(path, 'wb') as f:
+            f.truncate(length)
+
+        logger.debug('Node "%s", %i ranges, %i connections' % (node_id, len(ranges), connections))
+
+        with ThreadPoolExecutor(max_workers=connections) as executor:
+            futures = [executor.submit(self._download_range, node_id, path, start, end)
+                       for start, end in ranges]
+            try:
+                # unbuffered, ranges are written through other file objects
+                with open(path, 'rb', buffering=0) as f:
+                    for future, (start, end) in zip(futures, ranges):
+                        future.result()
+                        if not write_callbacks:
+                            continue
+                        f.seek(start)
+                        remaining = end - start + 1
+                        while remaining > 0:
+                            chunk = f.read(min(chunk_sz, remaining))
+                            for wcb in write_callbacks:
+                                wcb(chunk)
+                            remaining -= len(chunk)
+            except:
+                for future in futures:
+                    future.cancel()
+                raise
+
+    def _download_range(self, node_id: str, path: str, start: int, end: int):
+        """Downloads byte range *start*-*end* (inclusive) into the preallocated file *path*."""
+
+        with open(path, 'r+b') as f:
+            f.seek(start)
+            self.chunked_download(node_id, f, offset=start, length=end + 1)
+            pos = f.tell()
+        if pos <= end:
+            raise RequestError(RequestError.CODE.INCOMPLETE_RESULT,
+                               '[acd_api] range download incomplete. '
+                               'Expected %i, got %i.' % (end + 1, pos))
+
     @catch_conn_exception
     def chunked_download(self, node_id: str, file: io.BufferedWriter, **kwargs):
         """:param kwargs:
@@ -22,7 +22,9 @@ _ROOT_ID_SQL = 'SELECT id FROM nodes WHERE name IS NULL AND type == "folder" ORD
 _SETTINGS_FILENAME = 'cache.ini'
 
 _def_conf = configparser.ConfigParser()
-_def_conf['sqlite'] = dict(filename='nodes.db', busy_timeout=30000, journal_mode='wal')
+_def_conf['sqlite'] = dict(filename='nodes.db', busy_timeout=30000, journal_mode='wal',
+                          synchronous='normal', cache_size=-16384, temp_store='memory',
+                          mmap_size=256 * 1024 ** 2)
 _def_conf['blacklist'] = dict(folders=[])
 
 
@@ -51,12 +53,18 @@ class NodeCache(SchemaMixin, QueryMixin, SyncMixin, FormatterMixin):
     IntegrityCheckType = dict(full=0, quick=1, none=2)
     """types of SQLite integrity checks"""
 
+    _CONN_PRAGMAS = ['busy_timeout', 'synchronous', 'cache_size', 'temp_store', 'mmap_size']
+    """pragmas that only apply to the connection they are set on"""
+
     def __init__(self, cache_path: str='', settings_path='', check=IntegrityCheckType['full']):
         self._conf = get_conf(settings_path, _SETTINGS_FILENAME, _def_conf)
 
         self.db_path = os.path.join(cache_path, self._conf['sqlite']['filename'])
         self.tl = local()
 
+        if sys.version_info[:3] != (3, 6, 0):
+            self._execute_pragma('journal_mode', self._conf['sqlite']['journal_mode'])
+
         self.integrity_check(check)
         try:
             self.init()
@@ -78,14 +86,12 @@ class NodeCache(SchemaMixin, QueryMixin, SyncMixin, FormatterMixin):
 
             self.root_id = first_id
 
-        self._execute_pragma('busy_timeout', self._conf['sqlite']['busy_timeout'])
-        if sys.version_info[:3] != (3, 6, 0):
-            self._execute_pragma('journal_mode', self._conf['sqlite']['journal_mode'])
-
     @property
     def _conn(self) -> sqlite3.Connection:
         if not hasattr(self.tl, '_conn'):
             self.tl._conn = _create_conn(self.db_path)
+            for pragma in self._CONN_PRAGMAS:
+                self._execute_pragma(pragma, self._conf['sqlite'][pragma])
         return self.tl._conn
 
     def _execute_pragma(self, key, value) -> str:
@@ -19,6 +19,12 @@ CONFLICTING_NODE_SQL = """SELECT n.*, f.* FROM nodes n
                   WHERE p.parent = (?) AND LOWER(name) = (?) AND status = 'AVAILABLE'
                   ORDER BY n.name"""
 
+AVAILABLE_CHILDREN_SQL = """SELECT n.*, f.* FROM nodes n
+                  JOIN parentage p ON n.id = p.child
+                  LEFT OUTER JOIN files f ON n.id = f.id
+                  WHERE p.parent = (?) AND status = 'AVAILABLE'
+                  ORDER BY n.name"""
+
 CHILDREN_SQL = """SELECT n.*, f.* FROM nodes n
                   JOIN parentage p ON n.id = p.child
                   LEFT OUTER JOIN files f ON n.id = f.id
@@ -48,6 +54,15 @@ CHILD_OF_SQL = """SELECT n.*, f.* FROM nodes n
                   WHERE n.name = (?) AND p.parent = (?)
                   ORDER BY n.status"""
 
+CHILDREN_BY_NAMES_SQL = """SELECT n.*, f.* FROM nodes n
+                  JOIN parentage p ON n.id = p.child
+                  LEFT OUTER JOIN files f ON n.id = f.id
+                  WHERE p.parent = (?) AND n.name IN (%s)
+                  ORDER BY n.status"""
+
+# stay below SQLite's default maximum number of host parameters
+MAX_NAMES_PER_QUERY = 900
+
 NODE_BY_ID_SQL = """SELECT n.*, f.* FROM nodes n LEFT OUTER JOIN files f ON n.id = f.id
                     WHERE n.id = (?)"""
 
@@ -87,6 +102,8 @@ class Node(object):
         self.description = row['description']
         self.cre = row['created']
         self.mod = row['modified']
+        self._created = None
+        self._modified = None
         self.updated = row['updated']
         self.status = row['status']
 
@@ -126,11 +143,15 @@ class Node(object):
 
     @property
     def created(self):
-        return datetime_from_string(self.cre)
+        if self._created is None:
+            self._created = datetime_from_string(self.cre)
+        return self._created
 
     @property
     def modified(self):
-        return datetime_from_string(self.mod)
+        if self._modified is None:
+            self._modified = datetime_from_string(self.mod)
+        return self._modified
 
     @property
     def simple_name(self):
@@ -158,50 +179,84 @@ class QueryMixin(object):
             if r:
                 return Node(r)
 
-    def resolve(self, path: str, trash=False) -> 'Union[Node|None]':
-        segments = list(filter(bool, path.split('/')))
-        if not segments:
-            if not self.root_id:
-                return
-            with cursor(self._conn) as c:
-                c.execute(NODE_BY_ID_SQL, [self.root_id])
+    def get_conflicting_nodes(self, parent_id: str) -> 'Dict[str, Node]':
+        """Maps the lower case names of all available children of the folder specified by
+        *parent_id* to their nodes. Allows for repeated :meth:`get_conflicting_node` lookups
+        in the same folder using a single query."""
+        nodes = {}
+        with cursor(self._conn) as c:
+            c.execute(AVAILABLE_CHILDREN_SQL, [parent_id])
+            r = c.fetchone()
+            while r:
+                node = Node(r)
+                nodes.setdefault(node.name.lower(), node)
                 r = c.fetchone()
-                return Node(r)
+        return nodes
 
-        parent = self.root_id
-        for i, segment in enumerate(segments):
+    def resolve(self, path: str, trash=False) -> 'Union[Node|None]':
+        return self.resolve_paths([path], trash).get(path)
+
+    def resolve_paths(self, paths: 'Iterable[str]', trash=False) -> 'Dict[str, Node]':
+        """Resolves multiple paths at once. The paths are walked down level by level,
+        querying the children of each folder only once per level for all segment names
+        needed from it, so that common prefixes are resolved once.
+
+        :returns: dict of the resolvable paths and their nodes"""
+
+        resolved = {}
+        level = {}  # parent ID -> [(path, remaining segments)]
+
+        for path in paths:
+            segments = list(filter(bool, path.split('/')))
+            if segments:
+                level.setdefault(self.root_id, []).append((path, segments))
+            elif self.root_id:
+                resolved[path] = self.get_node(self.root_id)
+
+        while level:
+            next_level = {}
+            for parent, pending in level.items():
+                children = self._children_by_names(parent, {segs[0] for _, segs in pending})
+                for path, segments in pending:
+                    rows = children.get(segments[0])
+                    if not rows:
+                        continue
+                    r = rows[0]
+
+                    if not r.is_available:
+                        if not trash:
+                            continue
+                        if len(rows) > 1:
+                            logger.debug('None-unique trash name "%s" in %s.'
+                                         % (segments[0], parent))
+                            continue
+                    if len(segments) == 1:
+                        resolved[path] = r
+                    elif r.is_folder:
+                        next_level.setdefault(r.id, []).append((path, segments[1:]))
+            level = next_level
+
+        return resolved
+
+    def _children_by_names(self, parent_id: str, names: set) -> 'Dict[str, List[Node]]':
+        """:returns: dict of names to the children of that name, available nodes first"""
+        names = list(names)
+        children = {}
+        for i in range(0, len(names), MAX_NAMES_PER_QUERY):
+            chunk = names[i:i + MAX_NAMES_PER_QUERY]
             with cursor(self._conn) as c:
-                c.execute(CHILD_OF_SQL, [segment, parent])
+                c.execute(CHILDREN_BY_NAMES_SQL % ','.join('?' * len(chunk)), [parent_id] + chunk)
                 r = c.fetchone()
-                r2 = c.fetchone()
-
-            if not r:
-                return
-            r = Node(r)
-
-            if not r.is_available:
-                if not trash:
-                    return
-                if r2:
-                    logger.debug('None-unique trash name "%s" in %s.' % (segment, parent))
-                    return
-            if i + 1 == len(segments):
-                return r
-            if r.is_folder:
-                parent = r.id
-                continue
-            else:
-                return
+                while r:
+                    node = Node(r)
+                    children.setdefault(node.name, []).append(node)
+                    r = c.fetchone()
+        return children
 
     def childrens_names(self, folder_id) -> 'List[str]':
         with cursor(self._conn) as c:
             c.execute(CHILDRENS_NAMES_SQL, [folder_id])
-            kids = []
-            row = c.fetchone()
-            while row:
-                kids.append(row['name'])
-                row = c.fetchone()
-            return kids
+            return [row['name'] for row in c.fetchall()]
 
     def get_node_count(self) -> int:
         with cursor(self._conn) as c:
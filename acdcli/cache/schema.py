@@ -53,7 +53,8 @@ _CREATION_SCRIPT = """
     );
 
     CREATE INDEX ix_nodes_names ON nodes(name);
-    PRAGMA user_version = 2;
+    CREATE INDEX ix_parentage_child ON parentage(child);
+    PRAGMA user_version = 3;
     """
 
 _GEN_DROP_TABLES_SQL = \
@@ -79,12 +80,20 @@ def _1_to_2(conn):
     conn.commit()
 
 
-_migrations = [_0_to_1, _1_to_2]
+def _2_to_3(conn):
+    conn.executescript(
+        'CREATE INDEX IF NOT EXISTS ix_parentage_child ON parentage(child);'
+        'PRAGMA user_version = 3;'
+    )
+    conn.commit()
+
+
+_migrations = [_0_to_1, _1_to_2, _2_to_3]
 """list of all migrations from index -> index+1"""
 
 
 class SchemaMixin(object):
-    _DB_SCHEMA_VER = 2
+    _DB_SCHEMA_VER = 3
 
     def init(self):
         try:
@@ -3,7 +3,7 @@ Syncs Amazon Node API objects with SQLite database.
 """
 
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from itertools import islice
 from .cursors import mod_cursor
 import dateutil.parser as iso_date
@@ -25,6 +25,18 @@ def placeholders(args):
     return '(%s)' % ','.join('?' * len(args))
 
 
+_DATE_FMT = '%Y-%m-%dT%H:%M:%S.%fZ'
+
+
+def parse_date(date_str: str) -> datetime:
+    """Parses an ACD timestamp (e.g. '2015-01-01T00:00:00.000Z') into a UTC datetime.
+    Falls back to the much slower generic dateutil parser for unexpected formats."""
+    try:
+        return datetime.strptime(date_str, _DATE_FMT).replace(tzinfo=timezone.utc)
+    except ValueError:
+        return iso_date.parse(date_str)
+
+
 class SyncMixin(object):
     """Sync mixin to the :class:`NodeCache <acdcli.cache.db.NodeCache>`"""
 
@@ -36,8 +48,8 @@ class SyncMixin(object):
         if not purged:
             return
 
-        for slice_ in gen_slice(purged):
-            with mod_cursor(self._conn) as c:
+        with mod_cursor(self._conn) as c:
+            for slice_ in gen_slice(purged):
                 c.execute('DELETE FROM nodes WHERE id IN %s' % placeholders(slice_), slice_)
                 c.execute('DELETE FROM files WHERE id IN %s' % placeholders(slice_), slice_)
                 c.execute('DELETE FROM parentage WHERE parent IN %s' % placeholders(slice_), slice_)
@@ -68,10 +80,12 @@ class SyncMixin(object):
                 folders.append(node)
             elif kind != 'ASSET':
                 logger.warning('Cannot insert unknown node type "%s".' % kind)
-        self.insert_folders(folders)
-        self.insert_files(files)
 
-        self.insert_parentage(files + folders, partial)
+        # single transaction for all node types
+        with mod_cursor(self._conn) as c:
+            self._insert_folders(c, folders)
+            self._insert_files(c, files)
+            self._insert_parentage(c, files + folders, partial)
 
     def insert_node(self, node: dict):
         """Inserts single file or folder into cache."""
@@ -88,58 +102,77 @@ class SyncMixin(object):
             return
 
         with mod_cursor(self._conn) as c:
-            for f in folders:
-                c.execute(
-                    'INSERT OR REPLACE INTO nodes '
-                    '(id, type, name, description, created, modified, updated, status) '
-                    'VALUES (?, "folder", ?, ?, ?, ?, ?, ?)',
-                    [f['id'], f.get('name'), f.get('description'),
-                     iso_date.parse(f['createdDate']), iso_date.parse(f['modifiedDate']),
-                     datetime.utcnow(),
-                     f['status']
-                     ]
-                )
-
-        logger.info('Inserted/updated %d folder(s).' % len(folders))
+            self._insert_folders(c, folders)
 
     def insert_files(self, files: list):
         if not files:
             return
 
         with mod_cursor(self._conn) as c:
-            for f in files:
-                c.execute('INSERT OR REPLACE INTO nodes '
-                          '(id, type, name, description, created, modified, updated, status)'
-                          'VALUES (?, "file", ?, ?, ?, ?, ?, ?)',
-                          [f['id'], f.get('name'), f.get('description'),
-                           iso_date.parse(f['createdDate']), iso_date.parse(f['modifiedDate']),
-                           datetime.utcnow(),
-                           f['status']
-                           ]
-                          )
-                c.execute('INSERT OR REPLACE INTO files (id, md5, size) VALUES (?, ?, ?)',
-                          [f['id'],
-                           f.get('contentProperties', {}).get('md5',
-                                                              'd41d8cd98f00b204e9800998ecf8427e'),
-                           f.get('contentProperties', {}).get('size', 0)
-                           ]
-                          )
+            self._insert_files(c, files)
+
+    def insert_parentage(self, nodes: list, partial=True):
+        if not nodes:
+            return
+
+        with mod_cursor(self._conn) as c:
+            self._insert_parentage(c, nodes, partial)
+
+    @staticmethod
+    def _insert_folders(c, folders: list):
+        if not folders:
+            return
+
+        updated = datetime.utcnow()
+        c.executemany(
+            'INSERT OR REPLACE INTO nodes '
+            '(id, type, name, description, created, modified, updated, status) '
+            'VALUES (?, "folder", ?, ?, ?, ?, ?, ?)',
+            ([f['id'], f.get('name'), f.get('description'),
+              parse_date(f['createdDate']), parse_date(f['modifiedDate']),
+              updated,
+              f['status']
+              ] for f in folders)
+        )
+
+        logger.info('Inserted/updated %d folder(s).' % len(folders))
+
+    @staticmethod
+    def _insert_files(c, files: list):
+        if not files:
+            return
+
+        updated = datetime.utcnow()
+        c.executemany('INSERT OR REPLACE INTO nodes '
+                      '(id, type, name, description, created, modified, updated, status)'
+                      'VALUES (?, "file", ?, ?, ?, ?, ?, ?)',
+                      ([f['id'], f.get('name'), f.get('description'),
+                        parse_date(f['createdDate']), parse_date(f['modifiedDate']),
+                        updated,
+                        f['status']
+                        ] for f in files)
+                      )
+        c.executemany('INSERT OR REPLACE INTO files (id, md5, size) VALUES (?, ?, ?)',
+                      ([f['id'],
+                        f.get('contentProperties', {}).get('md5',
+                                                           'd41d8cd98f00b204e9800998ecf8427e'),
+                        f.get('contentProperties', {}).get('size', 0)
+                        ] for f in files)
+                      )
 
         logger.info('Inserted/updated %d file(s).' % len(files))
 
-    def insert_parentage(self, nodes: list, partial=True):
+    @staticmethod
+    def _insert_parentage(c, nodes: list, partial=True):
         if not nodes:
             return
 
         if partial:
-            with mod_cursor(self._conn) as c:
-                for slice_ in gen_slice(nodes):
-                    c.execute('DELETE FROM parentage WHERE child IN %s' % placeholders(slice_),
-                              [n['id'] for n in slice_])
+            for slice_ in gen_slice(nodes):
+                c.execute('DELETE FROM parentage WHERE child IN %s' % placeholders(slice_),
+                          [n['id'] for n in slice_])
 
-        with mod_cursor(self._conn) as c:
-            for n in nodes:
-                for p in n['parents']:
-                    c.execute('INSERT OR IGNORE INTO parentage VALUES (?, ?)', [p, n['id']])
+        c.executemany('INSERT OR IGNORE INTO parentage VALUES (?, ?)',
+                      ([p, n['id']] for n in nodes for p in n['parents']))
 
         logger.info('Parented %d node(s).' % len(nodes))
@@ -1,6 +1,10 @@
 import hashlib
 import logging
 import os
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import cpu_count
+from threading import Thread
 
 logger = logging.getLogger(__name__)
 
@@ -18,16 +22,100 @@ class IncrementalHasher(object):
         return self.hasher.hexdigest()
 
 
+class ThreadedHasher(object):
+    """Incremental hasher that hashes chunks on a separate thread,
+    so that hashing overlaps with the transfer of subsequent chunks.
+    Small chunks are collected into batches of :attr:`BATCH_SIZE` bytes first, because
+    handing each one to the thread would cost more than hashing it right away."""
+
+    BATCH_SIZE = 1024 ** 2
+    MAX_PENDING_BATCHES = 8
+
+    def __init__(self):
+        self.q = queue.Queue(maxsize=self.MAX_PENDING_BATCHES)
+        self.hasher = hashlib.md5()
+        self.batch = bytearray()
+        self.stopped = False
+
+        # the thread must not reference self, so that __del__ can stop it
+        self.thread = Thread(target=self._hash, args=(self.q, self.hasher))
+        self.thread.daemon = True
+        self.thread.start()
+
+    @staticmethod
+    def _hash(q: queue.Queue, hasher):
+        while True:
+            batch = q.get()
+            if batch is None:
+                return
+            hasher.update(batch)
+
+    def update(self, chunk):
+        # the chunk is copied, callers may reuse its buffer
+        self.batch += chunk
+        if len(self.batch) >= self.BATCH_SIZE:
+            self.q.put(self.batch)
+            self.batch = bytearray()
+
+    def stop(self):
+        """Ends the hashing thread after all pending chunks were hashed."""
+        if not self.stopped:
+            self.stopped = True
+            if self.batch:
+                self.q.put(self.batch)
+                self.batch = bytearray()
+            self.q.put(None)
+
+    def get_result(self) -> str:
+        self.stop()
+        self.thread.join()
+        return self.hasher.hexdigest()
+
+    def __del__(self):
+        self.stop()
+
+
+HASH_BUFFER_SIZE = 1024 ** 2
+
+
 def hash_file_obj(fo) -> str:
+    """Hashes a binary file object from the start. Reads into a single reused buffer
+    instead of allocating a new bytes object per chunk."""
     hasher = hashlib.md5()
+    buf = bytearray(HASH_BUFFER_SIZE)
+    view = memoryview(buf)
     fo.seek(0)
-    for chunk in iter(lambda: fo.read(1024 ** 2), b''):
-        hasher.update(chunk)
+    while True:
+        read = fo.readinto(buf)
+        if not read:
+            break
+        hasher.update(view[:read])
     return hasher.hexdigest()
 
 
 def hash_file(file_name: str) -> str:
-    with open(file_name, 'rb') as f:
+    with open(file_name, 'rb', buffering=0) as f:
         md5 = hash_file_obj(f)
     logger.debug('MD5 of "%s" is %s' % (os.path.basename(file_name), md5))
-    return md5
\ No newline at end of file
+    return md5
+
+
+def hash_files(file_names: list, max_workers: int = None) -> dict:
+    """Hashes multiple files concurrently. hashlib releases the GIL while hashing,
+    so several files are hashed on multiple cores.
+
+    :param max_workers: number of hashing threads, defaults to the number of CPUs
+    :returns: dict of file name to MD5; files that could not be read are omitted"""
+
+    if not file_names:
+        return {}
+
+    md5s = {}
+    with ThreadPoolExecutor(max_workers=max_workers or cpu_count()) as executor:
+        futures = [(fn, executor.submit(hash_file, fn)) for fn in file_names]
+        for fn, future in futures:
+            try:
+                md5s[fn] = future.result()
+            except OSError as e:
+                logger.debug('Hashing "%s" failed: %s' % (fn, e))
+    return md5s
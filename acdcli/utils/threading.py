@@ -25,6 +25,8 @@ class QueuedLoader(object):
         self.retries = min(abs(max_retries), self.MAX_RETRIES)
 
         self.mp = progress.MultiProgress()
+        self._started = False
+        self._printer = None
 
     def _print_prog(self):
         while not self.halt:
@@ -47,33 +49,47 @@ class QueuedLoader(object):
             self.q.task_done()
 
     def add_jobs(self, jobs: list):
-        """:param jobs: list of partials that return a RetryRetVal and have a pg_handler kwarg"""
+        """Queues jobs. Jobs added after :meth:`start_workers` will be picked up immediately.
+
+        :param jobs: list of partials that return a RetryRetVal and have a pg_handler kwarg"""
         for job in jobs:
             h = job.keywords.get('pg_handler')
             self.mp.add(h)
             self.q.put(job)
 
-    def start(self) -> int:
-        """Starts worker threads and, if applicable, progress printer thread.
-        :returns: accumulated return value"""
+    def start_workers(self):
+        """Starts worker threads and, if applicable, progress printer thread
+        without waiting for the queued jobs to finish."""
 
-        _logger.info('%d jobs in queue.' % self.q.qsize())
-
-        p = None
-        print_progress = self.print_progress and self.q.qsize() > 0
-        if print_progress:
-            p = Thread(target=self._print_prog)
-            p.daemon = True
-            p.start()
+        if self._started:
+            return
 
         for i in range(self.workers):
             t = Thread(target=self._worker_task, args=(i,), name='worker-' + str(i))
             t.daemon = True
             t.start()
 
+        if self.print_progress:
+            self._printer = Thread(target=self._print_prog)
+            self._printer.daemon = True
+            self._printer.start()
+
+        self._started = True
+
+    def join(self) -> int:
+        """Blocks until all queued jobs are done.
+        :returns: accumulated return value"""
+
         self.q.join()
         self.halt = True
-        if p:
-            p.join()
+        if self._printer:
+            self._printer.join()
 
         return self.exit_stat
+
+    def start(self) -> int:
+        """Starts worker threads and, if applicable, progress printer thread.
+        :returns: accumulated return value"""
+
+        self.start_workers()
+        return self.join()
@@ -1,5 +1,6 @@
 import os
 import re
+import sys
 from setuptools import setup, find_packages
 from distutils.version import StrictVersion
 import acdcli
@@ -17,6 +18,8 @@ StrictVersion(version)
 
 dependencies = ['appdirs', 'colorama', 'fusepy', 'python_dateutil',
                 'requests>=2.1.0,!=2.9.0,!=2.12.0', 'requests_toolbelt!=0.5.0']
+if sys.version_info < (3, 5):
+    dependencies.append('scandir')
 doc_dependencies = ['sphinx_paramlinks']
 test_dependencies = ['httpretty<0.8.11', 'mock']
 
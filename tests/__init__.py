@@ -3,7 +3,9 @@ from unittest import TestLoader, TestSuite
 from .test_actions import ActionTestCase
 from .test_api import APITestCase
 from .test_cache import CacheTestCase
+from .test_fuse import ReadProxyTestCase, WriteStreamTestCase, ResolveTestCase
 from .test_helper import HelperTestCase
+from .test_utils import UtilsTestCase
 
 
 def get_suite() -> TestSuite:
@@ -13,6 +15,10 @@ def get_suite() -> TestSuite:
     all_tests.addTest(TestLoader().loadTestsFromTestCase(ActionTestCase))
     all_tests.addTest(TestLoader().loadTestsFromTestCase(APITestCase))
     all_tests.addTest(TestLoader().loadTestsFromTestCase(CacheTestCase))
+    all_tests.addTest(TestLoader().loadTestsFromTestCase(ReadProxyTestCase))
+    all_tests.addTest(TestLoader().loadTestsFromTestCase(WriteStreamTestCase))
+    all_tests.addTest(TestLoader().loadTestsFromTestCase(ResolveTestCase))
     all_tests.addTest(TestLoader().loadTestsFromTestCase(HelperTestCase))
+    all_tests.addTest(TestLoader().loadTestsFromTestCase(UtilsTestCase))
 
     return all_tests
@@ -3,11 +3,14 @@ from mock import patch, mock_open, MagicMock, sentinel
 import os
 import sys
 import json
+import hashlib
 import httpretty
 
 import acd_cli
 
+from acdcli.api.common import RequestError
 from acdcli.cache import db
+from acdcli.utils import progress
 
 from .test_helper import gen_file, gen_folder, gen_bunch_of_nodes
 
@@ -65,6 +68,16 @@ class ActionTestCase(unittest.TestCase):
         self.assertEqual(run_main(), None)
         self.assertEqual(len(print_.mock_calls), 100)
 
+    @patch('sys.stdout.write')
+    def testTreeNodeId(self, print_):
+        folder = gen_folder([])
+        files = [gen_file([folder]) for _ in range(10)]
+
+        self.cache.insert_nodes(files + [folder])
+        sys.argv.extend(['tree', '-t', folder['id']])
+        self.assertEqual(run_main(), None)
+        self.assertEqual(len(print_.mock_calls), 22)
+
     @patch('sys.stdout.write')
     def testList(self, print_):
         db.NodeCache(cache_path)
@@ -114,6 +127,82 @@ class ActionTestCase(unittest.TestCase):
         self.cache.insert_nodes([gen_folder()])
         self.assertEqual(run_main(), None)
 
+    # transfer
+
+    def _upload_fixture(self, content=b'foo') -> tuple:
+        """Creates a local file and a cached remote file of the same name and size
+        that is newer than the local one."""
+        path = os.path.join(cache_path, 'upload_test')
+        with open(path, 'wb') as f:
+            f.write(content)
+        self.addCleanup(lambda: os.path.exists(path) and os.remove(path))
+
+        root = gen_folder()
+        file = gen_file([root])
+        file.update(name='upload_test', status='AVAILABLE', modifiedDate='2100-01-01T00:00:00.000Z')
+        file['contentProperties'].update(size=len(content))
+        self.cache.insert_nodes([root, file])
+        self.cache.root_id = root['id']
+
+        acd_cli.cache = self.cache
+        acd_cli.acd_client = MagicMock()
+        return path, root, file
+
+    def testUploadFileStaleSiblings(self):
+        path, root, _ = self._upload_fixture()
+        acd_cli.acd_client.upload_file.side_effect = RequestError(409, 'conflict')
+        r = acd_cli.upload_file(path, root['id'], False, False, False, False,
+                                siblings={}, pg_handler=progress.FileProgress(3))
+        self.assertEqual(r.ret_val, 0)
+        self.assertEqual(acd_cli.acd_client.upload_file.call_count, 1)
+
+    def testUploadFileSiblingsMiss(self):
+        path, root, _ = self._upload_fixture()
+        with patch.object(self.cache, 'get_conflicting_node') as get_conflicting_node:
+            acd_cli.upload_file(path, root['id'], False, False, False, False,
+                                siblings={}, pg_handler=progress.FileProgress(3))
+        self.assertFalse(get_conflicting_node.called)
+        self.assertTrue(acd_cli.acd_client.upload_file.called)
+
+    def testUploadFileUnchangedDuplicate(self):
+        path, root, _ = self._upload_fixture()
+        with patch('acdcli.utils.hashing.hash_file') as hash_file:
+            r = acd_cli.upload_file(path, root['id'], False, False, True, False,
+                                    pg_handler=MagicMock())
+        self.assertEqual(r.ret_val, acd_cli.DUPLICATE)
+        self.assertFalse(hash_file.called)
+        self.assertTrue(os.path.exists(path))
+
+    def testUploadFileOverwriteDuplicateRemoveSource(self):
+        path, root, file = self._upload_fixture()
+        file['contentProperties'].update(md5=hashlib.md5(b'foo').hexdigest())
+        self.cache.insert_nodes([file])
+        r = acd_cli.upload_file(path, root['id'], True, False, True, True,
+                                pg_handler=MagicMock())
+        self.assertEqual(r.ret_val, 0)
+        self.assertFalse(os.path.exists(path))
+        self.assertFalse(acd_cli.acd_client.overwrite_file.called)
+
+    def testUploadFileChangedSinceHashed(self):
+        path, root, file = self._upload_fixture()
+        file.update(name='other')
+        file['contentProperties'].update(md5=hashlib.md5(b'foo').hexdigest())
+        self.cache.insert_nodes([file])
+
+        entries = [e for e in acd_cli.scandir(cache_path) if e.name == 'upload_test']
+        hashes = acd_cli.hash_dedup_candidates(cache_path, entries, [], {}, False)
+        self.assertEqual(hashes[path][0], file['contentProperties']['md5'])
+
+        with open(path, 'wb') as f:
+            f.write(b'bar')
+        st = os.stat(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10 ** 9))
+
+        acd_cli.upload_file(path, root['id'], False, False, True, True,
+                            hashed=hashes[path], pg_handler=MagicMock())
+        self.assertTrue(acd_cli.acd_client.upload_file.called)
+        self.assertTrue(os.path.exists(path))
+
     # misc
 
     def testCheckCacheEmpty(self):
@@ -31,6 +31,11 @@ class APITestCase(unittest.TestCase):
     def testContentUrl(self):
         self.assertEqual(self.acd.content_url, 'https://content-na.drive.amazonaws.com/cdproxy/')
 
+    def testConnectionPoolSize(self):
+        adapter = self.acd.BOReq._BackOffRequest__session.get_adapter(self.acd.content_url)
+        self.assertEqual(adapter._pool_maxsize,
+                         self.acd._conf.getint('transfer', 'connection_pool_size'))
+
     def testValidID0(self):
         self.assertTrue(is_valid_id('abcdefghijklmnopqrstuv'))
 
@@ -123,6 +128,41 @@ class APITestCase(unittest.TestCase):
             tmp = self.acd.get_changes()
             [cs for cs in self.acd._iter_changes_lines(tmp)]
 
+    #
+    # content
+    #
+
+    def testDownloadRanged(self):
+        content = os.urandom(1000)
+        test_path = os.path.join(path, 'ranged_dl')
+
+        class Response(object):
+            def __init__(self, range_):
+                start, end = map(int, range_[len('bytes='):].split('-'))
+                self.body = content[start:end + 1]
+                self.status_code = 206
+                self.headers = {}
+
+            def iter_content(self, chunk_size):
+                return iter([self.body[i:i + chunk_size]
+                             for i in range(0, len(self.body), chunk_size)])
+
+            def close(self):
+                pass
+
+        self.acd.BOReq.get = lambda url, headers, **kwargs: Response(headers['Range'])
+        self.acd._conf['transfer']['dl_connections'] = '4'
+        self.acd._conf['transfer']['dl_range_size'] = '64'
+        chunks = []
+        try:
+            self.acd.download_file(gen_rand_id(), test_path, length=len(content),
+                                   write_callbacks=[chunks.append])
+            with open(test_path, 'rb') as f:
+                self.assertEqual(f.read(), content)
+        finally:
+            os.remove(test_path)
+        self.assertEqual(b''.join(chunks), content)
+
     #
     # oauth
     #
@@ -1,7 +1,9 @@
 import unittest
 import os
+from threading import Thread
+import dateutil.parser as iso_date
 
-from acdcli.cache import db, schema
+from acdcli.cache import db, schema, sync
 from .test_helper import gen_file, gen_folder, gen_bunch_of_nodes
 
 
@@ -14,6 +16,45 @@ class CacheTestCase(unittest.TestCase):
     def tearDown(self):
         db.NodeCache.remove_db_file(self.path)
 
+    def testConnectionPragmas(self):
+        results = []
+
+        def read_pragma():
+            with db.cursor(self.cache._conn) as c:
+                c.execute('PRAGMA busy_timeout;')
+                results.append(c.fetchone()[0])
+
+        t = Thread(target=read_pragma)
+        t.start()
+        t.join()
+        self.assertEqual(results, [int(self.cache._conf['sqlite']['busy_timeout'])])
+
+    def testMigrateParentageIndex(self):
+        conn = self.cache._conn
+        conn.executescript('DROP INDEX ix_parentage_child; PRAGMA user_version = 2;')
+        self.cache._migrate(2)
+        with db.cursor(conn) as c:
+            c.execute('PRAGMA user_version;')
+            self.assertEqual(c.fetchone()[0], schema.SchemaMixin._DB_SCHEMA_VER)
+            c.execute('SELECT name FROM sqlite_master WHERE type = "index" AND tbl_name = ?',
+                      ['parentage'])
+            self.assertIn('ix_parentage_child', [r[0] for r in c.fetchall()])
+
+    def testParseDate(self):
+        for date_str in ['2015-01-01T00:00:00.00Z', '2015-01-01T00:00:00.000Z',
+                         '2016-02-29T23:59:59.123456Z', '2015-01-01T00:00:00Z']:
+            self.assertEqual(sync.parse_date(date_str), iso_date.parse(date_str))
+
+    def testNodeDates(self):
+        folder = gen_folder()
+        self.cache.insert_node(folder)
+        n = self.cache.get_node(folder['id'])
+        self.assertEqual(n.modified,
+                         iso_date.parse(folder['modifiedDate']).replace(tzinfo=None))
+        self.assertIs(n.modified, n.modified)
+        self.assertEqual(n.created,
+                         iso_date.parse(folder['createdDate']).replace(tzinfo=None))
+
     def testEmpty(self):
         self.assertEqual(self.cache.get_node_count(), 0)
 
@@ -52,6 +93,14 @@ class CacheTestCase(unittest.TestCase):
         self.assertIn(file['id'], [n.id for n in fc])
         self.assertNotIn(file['id'], [n.id for n in rc])
 
+    def testInsertNodesSingleTransaction(self):
+        root = gen_folder()
+        file = gen_file([root])
+        del file['createdDate']
+        with self.assertRaises(KeyError):
+            self.cache.insert_nodes([root, file])
+        self.assertEqual(self.cache.get_node_count(), 0)
+
     def testPurge(self):
         root = gen_folder()
         file = gen_file([root])
@@ -85,6 +134,38 @@ class CacheTestCase(unittest.TestCase):
         fo, fi = self.cache.list_children(root['id'], trash=True)
         self.assertEqual(len(fo) + len(fi), len(files + folders))
 
+    def testConflictingNodes(self):
+        root = gen_folder()
+        files = [gen_file([root]) for _ in range(10)]
+        self.cache.insert_nodes([root] + files)
+        conflicting = self.cache.get_conflicting_nodes(root['id'])
+        for file in files:
+            node = self.cache.get_conflicting_node(file['name'], root['id'])
+            if node:
+                self.assertEqual(conflicting[file['name'].lower()].id, node.id)
+            else:
+                self.assertNotIn(file['name'].lower(), conflicting)
+
+    def testResolvePaths(self):
+        root = gen_folder()
+        folder = gen_folder([root])
+        folder['status'] = 'AVAILABLE'
+        files = [gen_file([folder]) for _ in range(5)]
+        for file in files:
+            file['status'] = 'AVAILABLE'
+        self.cache.insert_nodes(files + [folder, root])
+        self.cache.root_id = root['id']
+
+        folder_path = '/' + folder['name']
+        paths = [folder_path + '/' + file['name'] for file in files]
+        resolved = self.cache.resolve_paths(paths + ['/', folder_path, '/foo', paths[0] + '/bar'])
+        self.assertEqual(len(resolved), len(files) + 2)
+        self.assertEqual(resolved['/'].id, root['id'])
+        self.assertEqual(resolved[folder_path].id, folder['id'])
+        for path, file in zip(paths, files):
+            self.assertEqual(resolved[path].id, file['id'])
+            self.assertEqual(self.cache.resolve(path).id, file['id'])
+
     def testCalculateUsageEmpty(self):
         self.assertEqual(self.cache.calculate_usage(), 0)
 
@@ -0,0 +1,288 @@
+"""Isolated FUSE read and write proxy unit tests."""
+
+import unittest
+from mock import patch, MagicMock
+import configparser
+import errno
+import logging
+import os
+import random
+from functools import partial
+from threading import Thread, Lock, Event
+
+from acdcli.api.client import ACDClient
+from acdcli.acd_fuse import ACDFuse, ReadProxy, WriteProxy, FuseOSError, _def_conf
+from acdcli.cache import db
+
+from .test_helper import gen_file, gen_folder, gen_rand_id
+
+logging.basicConfig(level=logging.INFO)
+path = os.path.join(os.path.dirname(__file__), 'dummy_files')
+
+
+class ReadProxyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.acd = ACDClient(path)
+        self.acd.BOReq._wait = lambda: None
+        self.content = os.urandom(2 * 1024 ** 2)
+        self.responses = []
+        self.resp_lock = Lock()
+
+        content = self.content
+        responses = self.responses
+        resp_lock = self.resp_lock
+
+        class Response(object):
+            def __init__(self, range_):
+                start, end = map(int, range_[len('bytes='):].split('-'))
+                self.body = content[start:end + 1]
+                self.pos = 0
+                self.status_code = 206
+                self.headers = {'content-length': str(len(self.body))}
+                self.closed = False
+                with resp_lock:
+                    responses.append(self)
+
+            def iter_content(self, chunk_size):
+                while self.pos < len(self.body):
+                    b = self.body[self.pos:self.pos + chunk_size]
+                    self.pos += len(b)
+                    yield b
+
+            def close(self):
+                self.closed = True
+
+        self.acd.BOReq.get = lambda url, headers, **kwargs: Response(headers['Range'])
+
+    def testChunkSkipWindow(self):
+        chunk = ReadProxy.StreamChunk(self.acd, gen_rand_id(), 0, len(self.content))
+        skip = ReadProxy.StreamChunk.MAX_SKIP
+        self.assertFalse(chunk.has_byte_range_ahead(0, 4096))
+        self.assertTrue(chunk.has_byte_range_ahead(1, 4096))
+        self.assertTrue(chunk.has_byte_range_ahead(skip, 4096))
+        self.assertFalse(chunk.has_byte_range_ahead(skip + 1, 4096))
+        self.assertTrue(chunk.has_byte_range_ahead(skip, len(self.content) - skip))
+        self.assertFalse(chunk.has_byte_range_ahead(skip, len(self.content) - skip + 1))
+
+    def testReadForwardSkip(self):
+        rf = ReadProxy.ReadFile(10, 5)
+        id_, total = gen_rand_id(), len(self.content)
+        skip = ReadProxy.StreamChunk.MAX_SKIP
+
+        self.assertEqual(rf.get(self.acd, id_, 0, 4096, total), self.content[:4096])
+        offset = 4096 + skip
+        self.assertEqual(rf.get(self.acd, id_, offset, 4096, total),
+                         self.content[offset:offset + 4096])
+        self.assertEqual(len(self.responses), 1)
+
+        offset += skip + 4096 + 1
+        self.assertEqual(rf.get(self.acd, id_, offset, 4096, total),
+                         self.content[offset:offset + 4096])
+        self.assertEqual(len(self.responses), 2)
+
+    def testConcurrentOverlappingReads(self):
+        rf = ReadProxy.ReadFile(4, 5)
+        id_, total = gen_rand_id(), len(self.content)
+        mismatches = []
+
+        def read():
+            for _ in range(50):
+                offset = random.randint(0, 64) * 1024
+                bytes_ = rf.get(self.acd, id_, offset, 16 * 1024, total)
+                if bytes_ != self.content[offset:offset + 16 * 1024]:
+                    mismatches.append(offset)
+
+        threads = [Thread(target=read) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(mismatches, [])
+        self.assertLessEqual(len(rf.chunks), 4)
+        rf.clear()
+        self.assertTrue(all(r.closed for r in self.responses))
+
+    def testPutAfterClear(self):
+        rf = ReadProxy.ReadFile(4, 5)
+        chunk = ReadProxy.StreamChunk(self.acd, gen_rand_id(), 0, len(self.content))
+        rf.clear()
+        rf._put(chunk)
+        self.assertEqual(len(rf.chunks), 0)
+        self.assertTrue(self.responses[0].closed)
+
+    def testSmallFileCache(self):
+        rp = ReadProxy(self.acd, 10, 5, small_file_size=1024, small_file_cache_size=2048)
+        ids = [gen_rand_id() for _ in range(3)]
+
+        self.assertEqual(rp.get(ids[0], 10, 100, 1000, md5='a'), self.content[10:110])
+        self.assertEqual(rp.get(ids[0], 500, 100, 1000, md5='a'), self.content[500:600])
+        self.assertEqual(len(self.responses), 1)
+
+        # a changed file is downloaded again
+        rp.get(ids[0], 0, 100, 1000, md5='b')
+        self.assertEqual(len(self.responses), 2)
+
+        rp.get(ids[1], 0, 100, 1000, md5='a')
+        rp.get(ids[0], 0, 100, 1000, md5='b')
+        rp.get(ids[2], 0, 100, 1000, md5='a')
+        self.assertEqual(list(rp.small_files), [(ids[0], 'b'), (ids[2], 'a')])
+        self.assertEqual(rp.small_files_size, 2000)
+
+    def testSmallFileTruncated(self):
+        rp = ReadProxy(self.acd, 10, 5, small_file_size=1024, small_file_cache_size=2048)
+        get = self.acd.BOReq.get
+
+        def truncated_get(url, headers, **kwargs):
+            r = get(url, headers, **kwargs)
+            r.body = r.body[:-1]
+            return r
+
+        self.acd.BOReq.get = truncated_get
+        with self.assertRaises(FuseOSError) as cm:
+            rp.get(gen_rand_id(), 0, 100, 1000, md5='a')
+        self.assertEqual(cm.exception.errno, errno.EIO)
+        self.assertEqual(len(rp.small_files), 0)
+
+
+class WriteStreamTestCase(unittest.TestCase):
+    def setUp(self):
+        self.ws = WriteProxy.WriteStream(1, 10)
+        self.block = os.urandom(WriteProxy.WriteStream.BLOCK_SIZE)
+
+    def _start(self, target) -> Thread:
+        t = Thread(target=target)
+        t.daemon = True
+        t.start()
+        return t
+
+    def testWriteBlocksUntilError(self):
+        errors = []
+
+        def write():
+            try:
+                self.ws.write(self.block)
+            except FuseOSError as e:
+                errors.append(e)
+
+        self.ws.write(self.block)
+        t = self._start(write)
+        t.join(0.2)
+        self.assertTrue(t.is_alive())
+
+        self.ws.set_error()
+        t.join(1)
+        self.assertFalse(t.is_alive())
+        self.assertEqual(len(errors), 1)
+
+    def testWriteBlocksUntilRead(self):
+        self.ws.write(self.block)
+        t = self._start(lambda: self.ws.write(self.block))
+        t.join(0.2)
+        self.assertTrue(t.is_alive())
+
+        self.assertEqual(bytes(self.ws.read()), self.block)
+        t.join(1)
+        self.assertFalse(t.is_alive())
+        self.assertEqual(bytes(self.ws.read()), self.block)
+
+    def testSetDoneFlushes(self):
+        received = []
+
+        def read():
+            while True:
+                b = self.ws.read()
+                if not b:
+                    break
+                received.append(bytes(b))
+            self.ws.set_done()
+
+        t = self._start(read)
+        for _ in range(4):
+            self.ws.write(self.block)
+        self.ws.flush()
+        self.ws.close()
+        t.join(1)
+
+        self.assertTrue(self.ws.done.is_set())
+        self.assertEqual(b''.join(received), self.block * 4)
+
+    def testErrorOnClose(self):
+        t = self._start(self.ws.set_error)
+        with self.assertRaises(FuseOSError):
+            self.ws.close()
+        t.join(1)
+
+
+class ResolveTestCase(unittest.TestCase):
+    def setUp(self):
+        self.cache = db.NodeCache(path)
+        self.root = gen_folder()
+        self.cache.insert_nodes([self.root])
+        self.cache.root_id = self.root['id']
+
+    def tearDown(self):
+        db.NodeCache.remove_db_file(path)
+
+    def _mount(self, **resolve_conf) -> ACDFuse:
+        conf = configparser.ConfigParser()
+        conf.read_dict(_def_conf)
+        conf['resolve'].update(resolve_conf)
+        acd_client = MagicMock()
+        acd_client.fs_sizes.return_value = (0, 0)
+        return ACDFuse(cache=self.cache, acd_client=acd_client, conf=conf,
+                       autosync=partial(lambda stop: None, stop=Event()))
+
+    def _gen_child(self, gen, name) -> dict:
+        node = gen([self.root])
+        node.update(name=name, status='AVAILABLE')
+        return node
+
+    def testNegativeLookupClearedByMkdir(self):
+        fuse = self._mount()
+        self.assertIsNone(fuse._resolve('/dir'))
+        folder = self._gen_child(gen_folder, 'dir')
+        fuse.acd_client.create_folder.return_value = folder
+        fuse.mkdir('/dir', 0o777)
+        self.assertEqual(fuse._resolve('/dir').id, folder['id'])
+
+    def testNegativeLookupClearedByCreate(self):
+        fuse = self._mount()
+        self.assertIsNone(fuse._resolve('/file'))
+        file = self._gen_child(gen_file, 'file')
+        fuse.acd_client.create_file.return_value = file
+        fuse.create('/file', 0o666)
+        self.assertEqual(fuse._resolve('/file').id, file['id'])
+
+    def testLookupDuringInvalidation(self):
+        fuse = self._mount()
+        resolve = self.cache.resolve
+
+        def invalidating_resolve(path, trash=False):
+            node = resolve(path, trash)
+            fuse._invalidate()
+            return node
+
+        with patch.object(self.cache, 'resolve', side_effect=invalidating_resolve):
+            self.assertIsNone(fuse._resolve('/dir'))
+        self.assertNotIn(('/dir', False), fuse.resolved)
+
+    def testReuse(self):
+        fuse = self._mount()
+        with patch.object(self.cache, 'resolve', wraps=self.cache.resolve) as resolve:
+            fuse._resolve('/dir')
+            fuse._resolve('/dir')
+        self.assertEqual(resolve.call_count, 1)
+
+    def testNoReuseWithoutTTL(self):
+        fuse = self._mount(cache_ttl='0')
+        with patch.object(self.cache, 'resolve', wraps=self.cache.resolve) as resolve:
+            fuse._resolve('/dir')
+            fuse._resolve('/dir')
+        self.assertEqual(resolve.call_count, 2)
+
+    def testSizeBound(self):
+        fuse = self._mount(cache_size='2')
+        for p in ['/a', '/b', '/a', '/c']:
+            fuse._resolve(p)
+        self.assertEqual(list(fuse.resolved), [('/a', False), ('/c', False)])
@@ -0,0 +1,31 @@
+"""Isolated utility unit tests."""
+
+import unittest
+import hashlib
+import os
+
+from acdcli.utils import hashing
+
+
+class UtilsTestCase(unittest.TestCase):
+    def testThreadedHasher(self):
+        data = os.urandom(3 * hashing.ThreadedHasher.BATCH_SIZE + 4321)
+        for chunk_size in [8 * 1024, 128 * 1024, hashing.ThreadedHasher.BATCH_SIZE + 1,
+                           len(data)]:
+            h = hashing.ThreadedHasher()
+            for i in range(0, len(data), chunk_size):
+                h.update(data[i:i + chunk_size])
+            self.assertEqual(h.get_result(), hashlib.md5(data).hexdigest())
+
+    def testThreadedHasherEmpty(self):
+        self.assertEqual(hashing.ThreadedHasher().get_result(), hashlib.md5().hexdigest())
+
+    def testThreadedHasherReusedBuffer(self):
+        data = os.urandom(hashing.ThreadedHasher.BATCH_SIZE + 1000)
+        buf = bytearray(16 * 1024)
+        h = hashing.ThreadedHasher()
+        for i in range(0, len(data), len(buf)):
+            n = min(len(buf), len(data) - i)
+            buf[:n] = data[i:i + n]
+            h.update(memoryview(buf)[:n])
+        self.assertEqual(h.get_result(), hashlib.md5(data).hexdigest())